@@ -26,18 +26,28 @@ import re
 import time
 import logging
 import os
+import random
 import tempfile
 import socket
+import threading
+import functools
+import hashlib
+import gzip
+import zlib
+import http.client
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from pathlib import Path
-from datetime import datetime, timedelta
-from urllib.request import urlopen, Request
-from urllib.parse import quote_plus, urlencode, urlparse, urlunparse
+from datetime import date, datetime, timedelta
+from email.utils import parsedate_to_datetime
+from json.encoder import encode_basestring as _encode_str
+from urllib.request import urlopen, Request, getproxies, proxy_bypass
+from urllib.parse import quote_plus, urlencode, urljoin, urlparse, urlunparse
 from urllib.error import URLError, HTTPError
 from xml.etree import ElementTree as ET
-from html.parser import HTMLParser
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, List, Dict, Optional, Tuple
 
-from storage_paths import get_storage_paths
+from storage_paths import atomic_write_bytes, get_storage_paths
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 log = logging.getLogger(__name__)
@@ -55,13 +65,50 @@ MAX_RESULTS_UPPER_BOUND = 1000  # practical upper bound to reduce pagination
 DEFAULT_REQUEST_TIMEOUT = 30
 DEFAULT_REQUEST_RETRIES = 2
 DEFAULT_ATOM_RETRIES = 3
+DEFAULT_API_WORKERS = 4  # concurrent (category group, chunk) API jobs; pacing is shared
+MAX_CATEGORIES_PER_QUERY = 8  # categories OR'd into one search_query (bounds URL length)
+RSS_CATEGORIES_PER_FEED = 20  # categories '+'-joined into one RSS feed URL
+HTTP_CACHE_TTL_LIVE = 3600  # seconds; RSS, HTML listings and windows that may still change
+HTTP_CACHE_TTL_CLOSED = 15 * 86400  # seconds; past submission windows are effectively immutable
+CLOSED_WINDOW_LAG_DAYS = 3  # a window is "closed" once it ended this many days ago
+PARSED_CACHE_VERSION = 1  # bump when entry parsing changes so memoized pages are re-parsed
 USER_AGENT = "arxiv-digest-skill/1.0 (https://github.com/anthropics/claude)"
+MAX_REDIRECTS = 5
+OUTPUT_BUFFER_SIZE = 1 << 20  # bytes; write buffer for --output files
+MAX_RETRY_AFTER = 300  # seconds; cap on a server-requested Retry-After pause
+MAX_THROTTLE_BACKOFF = 60  # seconds; cap on exponential backoff after a bare 429/503
+MAX_RETRY_BACKOFF = 60  # seconds; cap on the jittered backoff after other transient errors
 
 # Atom / RSS namespaces
 ATOM_NS = "{http://www.w3.org/2005/Atom}"
 ARXIV_NS = "{http://arxiv.org/schemas/atom}"
 OPENSEARCH_NS = "{http://a9.com/-/spec/opensearch/1.1/}"
 
+# Fully qualified tags, built once instead of per findtext() call.
+_TAG_ENTRY = ATOM_NS + "entry"
+_TAG_ID = ATOM_NS + "id"
+_TAG_TITLE = ATOM_NS + "title"
+_TAG_SUMMARY = ATOM_NS + "summary"
+_TAG_AUTHOR = ATOM_NS + "author"
+_TAG_NAME = ATOM_NS + "name"
+_TAG_CATEGORY = ATOM_NS + "category"
+_TAG_PUBLISHED = ATOM_NS + "published"
+_TAG_UPDATED = ATOM_NS + "updated"
+_TAG_PRIMARY_CATEGORY = ARXIV_NS + "primary_category"
+_TAG_COMMENT = ARXIV_NS + "comment"
+_TAG_JOURNAL_REF = ARXIV_NS + "journal_ref"
+_TAG_DOI = ARXIV_NS + "doi"
+_TAG_TOTAL_RESULTS = OPENSEARCH_NS + "totalResults"
+
+# Patterns used per parsed entry / per CLI call, compiled once.
+_RE_TITLE_PREFIX = re.compile(r"^Title:\s*")
+_RE_AUTHORS_PREFIX = re.compile(r"^Authors?:\s*")
+_RE_AUTHORS_LINE = re.compile(r"Authors?:\s*(.+?)(?:\n|<br|$)")
+_RE_DAYS = re.compile(r"^(\d{1,3})d$")
+_RE_ISODATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_RE_ISOMONTH = re.compile(r"^\d{4}-\d{2}$")
+_RE_YMD = re.compile(r"^\d{8}$")
+
 
 def _resolve_prefs_path(prefs_path: Optional[str], default_prefs: Path) -> Optional[str]:
     """
@@ -100,6 +147,110 @@ def _resolve_prefs_path(prefs_path: Optional[str], default_prefs: Path) -> Optio
 # ---------------------------------------------------------------------------
 # Data model
 # ---------------------------------------------------------------------------
+def _strip_version(arxiv_id: str) -> str:
+    """Drop a trailing version suffix: 2501.01234v2 -> 2501.01234."""
+    head, sep, tail = arxiv_id.rpartition("v")
+    return head if sep and tail.isdigit() else arxiv_id
+
+
+def _collapse_ws(text: str) -> str:
+    """Collapse runs of whitespace to single spaces and trim the ends."""
+    # ' ' is the only character that is both whitespace and printable, so a
+    # printable string without doubled or edge spaces is already normalized.
+    if text.isprintable() and "  " not in text and text[:1] != " " and text[-1:] != " ":
+        return text
+    return " ".join(text.split())
+
+
+_PAPER_FIELDS = (
+    "arxiv_id",
+    "title",
+    "authors",
+    "abstract",
+    "categories",
+    "primary_category",
+    "published",
+    "updated",
+    "comment",
+    "journal_ref",
+    "doi",
+    "announce_type",
+)
+
+
+class Paper:
+    """
+    One normalized paper record.
+
+    A __slots__ class rather than a dict: a weekly multi-category run holds
+    thousands of these until output, and a slotted instance is roughly a
+    quarter the size of the equivalent 12-key dict. to_dict() produces the
+    output JSON shape, keys in _PAPER_FIELDS order. make_paper and
+    fetch_papers used to return dicts, so read/write item access (p["title"],
+    p.get("doi"), dict(p)) is kept for callers written against that.
+    """
+
+    __slots__ = _PAPER_FIELDS
+
+    def __init__(
+        self,
+        arxiv_id: str,
+        title: str,
+        authors: List[str],
+        abstract: str,
+        categories: List[str],
+        primary_category: str,
+        published: str,
+        updated: str,
+        comment: str,
+        journal_ref: str,
+        doi: str,
+        announce_type: str,
+    ):
+        self.arxiv_id = arxiv_id
+        self.title = title
+        self.authors = authors
+        self.abstract = abstract
+        self.categories = categories
+        self.primary_category = primary_category
+        self.published = published
+        self.updated = updated
+        self.comment = comment
+        self.journal_ref = journal_ref
+        self.doi = doi
+        self.announce_type = announce_type
+
+    def to_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in _PAPER_FIELDS}
+
+    def keys(self) -> Tuple[str, ...]:
+        return _PAPER_FIELDS
+
+    def get(self, key: str, default=None):
+        return getattr(self, key) if key in _PAPER_FIELDS else default
+
+    def __getitem__(self, key: str):
+        if key not in _PAPER_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value) -> None:
+        if key not in _PAPER_FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key: object) -> bool:
+        return key in _PAPER_FIELDS
+
+    def __repr__(self) -> str:
+        return f"Paper({self.arxiv_id!r}, {self.title!r})"
+
+
+def _split_authors(text: str) -> List[str]:
+    """Split a comma-separated author line, stripping each name once."""
+    return [name for name in (a.strip() for a in text.split(",")) if name]
+
+
 def make_paper(
     arxiv_id: str,
     title: str,
@@ -113,22 +264,76 @@ def make_paper(
     journal_ref: str = "",
     doi: str = "",
     announce_type: str = "new",
-) -> Dict:
-    """Create a normalized paper dict."""
-    return {
-        "arxiv_id": arxiv_id.strip(),
-        "title": " ".join(title.split()),  # collapse whitespace
-        "authors": authors,
-        "abstract": " ".join(abstract.split()),
-        "categories": categories,
-        "primary_category": primary_category or (categories[0] if categories else ""),
-        "published": published,
-        "updated": updated,
-        "comment": comment,
-        "journal_ref": journal_ref,
-        "doi": doi,
-        "announce_type": announce_type,
-    }
+) -> Paper:
+    """Create a normalized paper record."""
+    return Paper(
+        arxiv_id.strip(),
+        _collapse_ws(title),
+        authors,
+        _collapse_ws(abstract),
+        categories,
+        primary_category or (categories[0] if categories else ""),
+        published,
+        updated,
+        comment,
+        journal_ref,
+        doi,
+        announce_type,
+    )
+
+
+# '"field": ' prefixes for the hand-rolled indent=2 encoder below.
+_ENCODED_FIELDS = tuple((name, _encode_str(name) + ": ") for name in _PAPER_FIELDS)
+
+
+def _encode_paper(paper: Paper) -> str:
+    """
+    Encode one paper exactly as json.dumps(paper.to_dict(), indent=2,
+    ensure_ascii=False) renders it as an element of a top-level list.
+
+    json's C accelerator is bypassed whenever indent is set, so the stock
+    encoder walks every value in Python. Paper fields are strings or lists of
+    strings, which lets this call the C string escaper directly; any other
+    value falls back to the stock encoder.
+    """
+    parts = []
+    for name, prefix in _ENCODED_FIELDS:
+        value = getattr(paper, name)
+        if value.__class__ is str:
+            parts.append(prefix + _encode_str(value))
+        elif value.__class__ is list and all(v.__class__ is str for v in value):
+            if value:
+                parts.append(prefix + "[\n      " + ",\n      ".join(map(_encode_str, value)) + "\n    ]")
+            else:
+                parts.append(prefix + "[]")
+        else:
+            return json.dumps(paper.to_dict(), indent=2, ensure_ascii=False).replace("\n", "\n  ")
+    return "{\n    " + ",\n    ".join(parts) + "\n  }"
+
+
+def write_papers_json(papers: List[Paper], f) -> None:
+    """
+    Write papers as an indent=2 JSON array, one record at a time.
+
+    Output is byte-identical to json.dump([p.to_dict() ...], indent=2), but
+    only one record's text exists at a time.
+    """
+    if not papers:
+        f.write("[]")
+        return
+    sep = "[\n  "
+    for paper in papers:
+        f.write(sep)
+        f.write(_encode_paper(paper))
+        sep = ",\n  "
+    f.write("\n]")
+
+
+def write_papers_ndjson(papers: List[Paper], f) -> None:
+    """Write papers as newline-delimited JSON, one compact record per line."""
+    for paper in papers:
+        f.write(json.dumps(paper.to_dict(), ensure_ascii=False))
+        f.write("\n")
 
 
 # ---------------------------------------------------------------------------
@@ -155,6 +360,19 @@ def _is_dns_error(err: Exception) -> bool:
     return any(marker in msg for marker in dns_markers)
 
 
+# Responses worth retrying; any other HTTP error (404, 400, ...) is permanent.
+_RETRYABLE_STATUSES = frozenset((408, 429, 500, 502, 503, 504))
+
+
+def _is_permanent_http_error(err: Optional[BaseException]) -> bool:
+    """True for an HTTP error status that retrying cannot fix (follows causes)."""
+    while err is not None:
+        if isinstance(err, HTTPError):
+            return err.code not in _RETRYABLE_STATUSES
+        err = err.__cause__
+    return False
+
+
 def _fallback_urls(url: str) -> List[str]:
     """
     Return URL candidates to try when a host is unreachable.
@@ -172,17 +390,380 @@ def _fallback_urls(url: str) -> List[str]:
     return urls
 
 
-def fetch_url(url: str, retries: int = 2, timeout: int = 30) -> str:
-    """Fetch URL content as string with retries."""
+# Keep-alive connections, one per (scheme, host) per thread, so consecutive
+# API pages / feeds / listings reuse the same TCP+TLS session.
+_CONN_LOCAL = threading.local()
+
+
+def _get_connection(scheme: str, netloc: str, timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+    """Return (connection, reused) for the host, creating one if needed."""
+    pool = getattr(_CONN_LOCAL, "pool", None)
+    if pool is None:
+        pool = _CONN_LOCAL.pool = {}
+    conn = pool.get((scheme, netloc))
+    if conn is not None:
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+    if scheme == "https":
+        conn = http.client.HTTPSConnection(netloc, timeout=timeout)
+    else:
+        conn = http.client.HTTPConnection(netloc, timeout=timeout)
+    pool[(scheme, netloc)] = conn
+    return conn, False
+
+
+def _drop_connection(scheme: str, netloc: str) -> None:
+    pool = getattr(_CONN_LOCAL, "pool", {})
+    conn = pool.pop((scheme, netloc), None)
+    if conn is not None:
+        conn.close()
+
+
+def _uses_proxy(parsed) -> bool:
+    return parsed.scheme in getproxies() and not proxy_bypass(parsed.hostname or "")
+
+
+def _http_get(
+    url: str,
+    timeout: float,
+    headers: Optional[Dict[str, str]] = None,
+) -> Tuple[int, http.client.HTTPMessage, bytes]:
+    """
+    Single GET over a pooled keep-alive connection, following redirects.
+    Returns (status, response headers, body); status is 2xx or 304.
+    Raises HTTPError for error statuses and URLError for transport failures,
+    matching what urlopen would raise.
+    """
+    req_headers = {"User-Agent": USER_AGENT, "Accept-Encoding": "gzip"}
+    if headers:
+        req_headers.update(headers)
+
+    for _ in range(MAX_REDIRECTS + 1):
+        parsed = urlparse(url)
+        if parsed.scheme not in ("http", "https") or _uses_proxy(parsed):
+            # Proxies and exotic schemes go through urllib's handler chain.
+            req = Request(url, headers=req_headers)
+            try:
+                with urlopen(req, timeout=timeout) as resp:
+                    return resp.status, resp.headers, _decode_body(url, resp.headers, resp.read())
+            except HTTPError as e:
+                if e.code == 304:
+                    return 304, e.headers, b""
+                raise
+
+        target = parsed.path or "/"
+        if parsed.query:
+            target += "?" + parsed.query
+        while True:
+            conn, reused = _get_connection(parsed.scheme, parsed.netloc, timeout)
+            try:
+                conn.request("GET", target, headers=req_headers)
+                resp = conn.getresponse()
+                body = resp.read()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as e:
+                _drop_connection(parsed.scheme, parsed.netloc)
+                if reused:
+                    continue  # server closed an idle keep-alive socket; retry on a fresh one
+                raise URLError(e) from e
+            except TimeoutError:
+                _drop_connection(parsed.scheme, parsed.netloc)
+                raise
+            except (OSError, http.client.HTTPException) as e:
+                _drop_connection(parsed.scheme, parsed.netloc)
+                raise URLError(e) from e
+
+        if resp.will_close:
+            _drop_connection(parsed.scheme, parsed.netloc)
+
+        location = resp.getheader("Location")
+        if resp.status in (301, 302, 303, 307, 308) and location:
+            url = urljoin(url, location)
+            continue
+        if resp.status >= 400:
+            raise HTTPError(url, resp.status, resp.reason, resp.headers, None)
+        return resp.status, resp.headers, _decode_body(url, resp.headers, body)
+
+    raise HTTPError(url, resp.status, "Too many redirects", resp.headers, None)
+
+
+def _decode_body(url: str, headers: http.client.HTTPMessage, body: bytes) -> bytes:
+    """Undo gzip Content-Encoding (Atom XML shrinks roughly 5-10x on the wire)."""
+    encoding = (headers.get("Content-Encoding") or "").strip().lower()
+    if encoding not in ("gzip", "x-gzip") or not body:
+        return body
+    try:
+        return gzip.decompress(body)
+    except (OSError, EOFError, zlib.error) as e:
+        # A truncated/corrupt stream is a transport failure; let the caller retry.
+        raise URLError(f"bad gzip body from {url}: {e}") from e
+
+
+class HTTPCache:
+    """
+    On-disk response cache keyed by URL.
+
+    Each entry is a body file plus a small JSON sidecar holding the validators
+    (ETag / Last-Modified) and fetch time. Entries younger than the caller's
+    max_age are served without touching the network; older ones are
+    revalidated with a conditional GET and a 304 refreshes them in place.
+    The first store of a run prunes entries untouched for longer than the
+    largest TTL, so the directory does not grow without bound.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self._pruned = False
+
+    def _entry_paths(self, url: str) -> Tuple[Path, Path]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.root / f"{key}.body", self.root / f"{key}.json"
+
+    def load(self, url: str) -> Optional[Tuple[Dict, bytes]]:
+        body_path, meta_path = self._entry_paths(url)
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        if not isinstance(meta, dict) or meta.get("url") != url:
+            return None
+        return meta, body
+
+    def store(self, url: str, headers: http.client.HTTPMessage, body: bytes) -> None:
+        meta = {
+            "url": url,
+            "etag": headers.get("ETag", ""),
+            "last_modified": headers.get("Last-Modified", ""),
+            "fetched_at": time.time(),
+        }
+        body_path, meta_path = self._entry_paths(url)
+        if not self._pruned:
+            self._pruned = True
+            self.prune()
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            atomic_write_bytes(body_path, body)
+            atomic_write_bytes(meta_path, json.dumps(meta).encode("utf-8"))
+        except OSError as e:
+            log.warning(f"Could not write HTTP cache entry for {url}: {e}")
+
+    def touch(self, url: str, meta: Dict) -> None:
+        """Mark a revalidated (304) entry as fresh again."""
+        meta = dict(meta, fetched_at=time.time())
+        _, meta_path = self._entry_paths(url)
+        try:
+            atomic_write_bytes(meta_path, json.dumps(meta).encode("utf-8"))
+        except OSError as e:
+            log.warning(f"Could not refresh HTTP cache entry for {url}: {e}")
+
+    def discard(self, url: str) -> None:
+        """Drop the response and parsed memo for a URL (e.g. an empty page)."""
+        for path in (*self._entry_paths(url), self._parsed_path(url)):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def prune(self, max_age: float = HTTP_CACHE_TTL_CLOSED) -> None:
+        """Delete entries whose files were all last written over max_age seconds ago."""
+        cutoff = time.time() - max_age
+        newest: Dict[str, float] = {}
+        names: Dict[str, List[str]] = {}
+        try:
+            with os.scandir(self.root) as it:
+                for entry in it:
+                    key = entry.name.split(".", 1)[0]
+                    try:
+                        mtime = entry.stat().st_mtime
+                    except OSError:
+                        continue
+                    newest[key] = max(newest.get(key, 0.0), mtime)
+                    names.setdefault(key, []).append(entry.name)
+        except OSError:
+            return
+        for key, mtime in newest.items():
+            if mtime >= cutoff:
+                continue
+            for name in names[key]:
+                try:
+                    os.unlink(self.root / name)
+                except OSError:
+                    pass
+
+    def load_parsed(
+        self,
+        url: str,
+        digest: str,
+        parser: str,
+        max_age: float = 0,
+    ) -> Optional[Tuple[int, int, List[Paper]]]:
+        """
+        Return the memoized (total, raw entry count, papers) for this URL if it
+        was produced by `parser` from a body with the same sha256 digest and,
+        when max_age is set, was stored less than max_age seconds ago.
+        """
+        try:
+            with open(self._parsed_path(url)) as f:
+                memo = json.load(f)
+            if (
+                memo.get("version") != PARSED_CACHE_VERSION
+                or memo.get("digest") != digest
+                or memo.get("parser") != parser
+            ):
+                return None
+            if max_age and time.time() - memo.get("stored_at", 0) >= max_age:
+                return None
+            papers = [Paper(**d) for d in memo["papers"]]
+            return memo["total"], memo["entries"], papers
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return None
+
+    def store_parsed(
+        self,
+        url: str,
+        digest: str,
+        parser: str,
+        total: int,
+        n_entries: int,
+        papers: List[Paper],
+    ) -> None:
+        memo = {
+            "version": PARSED_CACHE_VERSION,
+            "digest": digest,
+            "parser": parser,
+            "total": total,
+            "entries": n_entries,
+            "stored_at": time.time(),
+            "papers": [p.to_dict() for p in papers],
+        }
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            atomic_write_bytes(
+                self._parsed_path(url),
+                json.dumps(memo, ensure_ascii=False).encode("utf-8"),
+            )
+        except OSError as e:
+            log.warning(f"Could not write parsed cache entry for {url}: {e}")
+
+    def _parsed_path(self, url: str) -> Path:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.root / f"{key}.parsed.json"
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket used to pace requests across concurrent workers.
+    A rate of ``1 / api_delay`` with capacity 1 reproduces arxiv's
+    "one request every N seconds" policy for the whole process.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_delay(cls, delay: float) -> "TokenBucket":
+        return cls(rate=1.0 / delay if delay > 0 else 0.0)
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until it is available (no-op if unlimited)."""
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._stamp) * self.rate)
+            self._stamp = now
+            # Reserve the token now; going negative queues later callers behind us.
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back new acquires for ``seconds`` (server asked us to back off)."""
+        if self.rate <= 0 or seconds <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._stamp) * self.rate)
+            self._stamp = now
+            # The next acquire waits at least `seconds`; later ones queue behind it.
+            self._tokens = min(self._tokens, 1.0 - seconds * self.rate)
+
+
+def _throttle_backoff(err: Exception, attempt: int) -> Optional[float]:
+    """
+    Seconds to back off after a 429/503 (None for any other error).
+    Honours Retry-After (delta-seconds or HTTP-date, capped at
+    MAX_RETRY_AFTER); without one, backs off exponentially per attempt.
+    """
+    if not isinstance(err, HTTPError) or err.code not in (429, 503):
+        return None
+    value = ((err.headers and err.headers.get("Retry-After")) or "").strip()
+    seconds = None
+    if value.isdigit():
+        seconds = float(value)
+    elif value:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            when = None
+        if when is not None and when.tzinfo is not None:
+            seconds = (when - datetime.now(when.tzinfo)).total_seconds()
+    if seconds is None:
+        return float(min(MAX_THROTTLE_BACKOFF, 2 ** (attempt + 1)))
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+def fetch_bytes(
+    url: str,
+    retries: int = 2,
+    timeout: int = 30,
+    limiter: Optional[TokenBucket] = None,
+    http_cache: Optional[HTTPCache] = None,
+    max_age: float = 0,
+) -> bytes:
+    """
+    Fetch URL content as raw bytes with retries. ``limiter`` gates every send.
+    With ``http_cache``, responses younger than ``max_age`` seconds are served
+    from disk and older ones are revalidated via If-None-Match/If-Modified-Since.
+    """
+    cached = http_cache.load(url) if http_cache is not None else None
+    cond_headers: Dict[str, str] = {}
+    if cached is not None:
+        meta, body = cached
+        if time.time() - meta.get("fetched_at", 0) < max_age:
+            return body
+        if meta.get("etag"):
+            cond_headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            cond_headers["If-Modified-Since"] = meta["last_modified"]
+
     errors: List[str] = []
     saw_dns_error = False
+    last_error: Optional[Exception] = None
     for candidate_url in _fallback_urls(url):
-        req = Request(candidate_url, headers={"User-Agent": USER_AGENT})
         for attempt in range(retries + 1):
             try:
-                with urlopen(req, timeout=timeout) as resp:
-                    return resp.read().decode("utf-8", errors="replace")
+                if limiter is not None:
+                    limiter.acquire()
+                status, headers, body = _http_get(candidate_url, timeout, cond_headers)
+                if status == 304 and cached is not None:
+                    http_cache.touch(url, cached[0])
+                    return cached[1]
+                if http_cache is not None:
+                    http_cache.store(url, headers, body)
+                return body
             except (URLError, HTTPError, TimeoutError) as e:
+                last_error = e
                 errors.append(f"{candidate_url} -> {e}")
                 log.warning(
                     f"Attempt {attempt+1}/{retries+1} failed for {candidate_url}: {e}"
@@ -191,8 +772,22 @@ def fetch_url(url: str, retries: int = 2, timeout: int = 30) -> str:
                     saw_dns_error = True
                     # DNS failures are not retryable in-process. Switch candidate host.
                     break
+                if _is_permanent_http_error(e):
+                    # e.g. 404: the same request will fail again. Switch candidate host.
+                    break
                 if attempt < retries:
-                    time.sleep(2 * (attempt + 1))
+                    backoff = _throttle_backoff(e, attempt)
+                    if backoff is None:
+                        # Exponential with full jitter, so parallel workers
+                        # sharing a limiter do not retry in lockstep.
+                        time.sleep(random.uniform(0, min(MAX_RETRY_BACKOFF, 2 ** (attempt + 1))))
+                    else:
+                        log.warning(f"Throttled by server; backing off {backoff:.0f}s")
+                        if limiter is not None and limiter.rate > 0:
+                            # Throttling applies to every worker sharing the limiter.
+                            limiter.pause(backoff)
+                        else:
+                            time.sleep(backoff)
 
     hint = (
         " DNS resolution failed for arXiv hosts. "
@@ -202,7 +797,94 @@ def fetch_url(url: str, retries: int = 2, timeout: int = 30) -> str:
     raise ConnectionError(
         f"Failed to fetch {url} via {len(_fallback_urls(url))} URL candidate(s).{dns_hint}\n"
         + "\n".join(errors)
+    ) from last_error
+
+
+def fetch_url(
+    url: str,
+    retries: int = 2,
+    timeout: int = 30,
+    http_cache: Optional[HTTPCache] = None,
+    max_age: float = 0,
+    limiter: Optional[TokenBucket] = None,
+) -> str:
+    """Fetch URL content as string with retries."""
+    body = fetch_bytes(
+        url,
+        retries=retries,
+        timeout=timeout,
+        limiter=limiter,
+        http_cache=http_cache,
+        max_age=max_age,
     )
+    return body.decode("utf-8", errors="replace")
+
+
+# ---------------------------------------------------------------------------
+# Atom streaming helpers
+# ---------------------------------------------------------------------------
+def _parse_atom_entries(
+    xml_bytes: bytes,
+    parse_entry: Callable[[ET.Element], Optional[Paper]],
+) -> Tuple[int, int, List[Paper]]:
+    """
+    Stream-parse an Atom document in a single pass.
+    Returns (totalResults, raw entry count, successfully parsed papers);
+    totalResults is 0 for feeds that do not carry it (RSS).
+
+    Each entry is cleared once parsed, so only one entry subtree is alive at a
+    time instead of the whole feed DOM. Only "end" events are requested: the
+    emptied <entry> shells left on the root are a few dozen bytes each, which
+    is cheaper than also taking a "start" event per element to find the root
+    and detach them.
+    """
+    total = 0
+    count = 0
+    papers = []
+    for _, elem in ET.iterparse(BytesIO(xml_bytes), events=("end",)):
+        tag = elem.tag
+        if tag == _TAG_ENTRY:
+            count += 1
+            paper = parse_entry(elem)
+            if paper:
+                papers.append(paper)
+            elem.clear()
+        elif tag == _TAG_TOTAL_RESULTS:
+            total = int(elem.text) if elem.text else 0
+    return total, count, papers
+
+
+def _parse_atom_page(
+    url: str,
+    xml_bytes: bytes,
+    parse_entry: Callable[[ET.Element], Optional[Paper]],
+    http_cache: Optional[HTTPCache] = None,
+) -> Tuple[int, int, List[Paper]]:
+    """
+    Parse one Atom page into (totalResults, raw entry count, papers).
+    With a cache, the result is memoized per URL and body digest, so a page
+    served again from the HTTP cache (fresh or via 304) skips XML parsing.
+    A body that fails to parse is dropped from the cache before the error
+    propagates, so a retry fetches it again instead of replaying it.
+    """
+    if http_cache is not None:
+        digest = hashlib.sha256(xml_bytes).hexdigest()
+        memo = http_cache.load_parsed(url, digest, parse_entry.__name__)
+        if memo is not None:
+            return memo
+    try:
+        total, n_entries, papers = _parse_atom_entries(xml_bytes, parse_entry)
+    except Exception:
+        if http_cache is not None:
+            http_cache.discard(url)
+        raise
+    if http_cache is not None and not n_entries:
+        # An entry-less page (totalResults 0, or a short read mid-stream) is
+        # often transient; keep it out of the cache so the next run refetches.
+        http_cache.discard(url)
+    elif http_cache is not None:
+        http_cache.store_parsed(url, digest, parse_entry.__name__, total, n_entries, papers)
+    return total, n_entries, papers
 
 
 # ---------------------------------------------------------------------------
@@ -219,77 +901,137 @@ def fetch_api_daterange(
     request_timeout: int = DEFAULT_REQUEST_TIMEOUT,
     request_retries: int = DEFAULT_REQUEST_RETRIES,
     atom_retries: int = DEFAULT_ATOM_RETRIES,
-) -> List[Dict]:
+    api_workers: int = DEFAULT_API_WORKERS,
+    http_cache: Optional[HTTPCache] = None,
+) -> List[Paper]:
     """
     Query the arxiv API for papers submitted in [date_from, date_to].
     Dates are YYYYMMDD format.
+
+    Categories are OR'd together (up to MAX_CATEGORIES_PER_QUERY per query)
+    so N categories cost one paginated stream instead of N. Each
+    (category group, chunk) job runs on a small thread pool; all workers share
+    one token bucket, so the aggregate request rate still honours api_delay
+    while network latency and parsing overlap across jobs.
     """
-    papers = []
+    # A window that closed a while ago cannot gain papers, so the merged result
+    # of an earlier complete run is reused without replaying any pages.
+    results_key = ""
+    if http_cache is not None and _window_is_closed(date_to):
+        results_key = (
+            f"{api_base}#closed-window?categories={','.join(categories)}"
+            f"&from={date_from}&to={date_to}&chunk_days={chunk_days}"
+            f"&max_results={max_results_per_query}"
+        )
+        memo = http_cache.load_parsed(
+            results_key, "", "fetch_api_daterange", max_age=HTTP_CACHE_TTL_CLOSED
+        )
+        if memo is not None:
+            log.info(f"API results for closed window {date_from}..{date_to} served from cache")
+            return memo[2]
+
     total_chunks = _build_date_chunks(date_from, date_to, chunk_days)
-    for cat in categories:
-        category_papers = []
+    limiter = TokenBucket.from_delay(api_delay)
+    groups = [
+        categories[i:i + MAX_CATEGORIES_PER_QUERY]
+        for i in range(0, len(categories), MAX_CATEGORIES_PER_QUERY)
+    ]
+    jobs = []
+    for group in groups:
+        label = ",".join(group)
         log.info(
-            f"API query for {cat}: {date_from}..{date_to} in {len(total_chunks)} chunk(s)"
+            f"API query for {label}: {date_from}..{date_to} in {len(total_chunks)} chunk(s)"
         )
-
         for i, (chunk_from, chunk_to) in enumerate(total_chunks, start=1):
-            log.info(
-                f"  [{cat}] chunk {i}/{len(total_chunks)}: "
-                f"submittedDate:[{chunk_from}* TO {chunk_to}*]"
-            )
+            jobs.append((label, group, i, chunk_from, chunk_to))
+
+    def run_job(job: Tuple[str, List[str], int, str, str]) -> Tuple[List[Paper], bool]:
+        label, group, i, chunk_from, chunk_to = job
+        log.info(
+            f"  [{label}] chunk {i}/{len(total_chunks)}: "
+            f"submittedDate:[{chunk_from}* TO {chunk_to}*]"
+        )
+        return _fetch_api_daterange_chunk(
+            group,
+            chunk_from,
+            chunk_to,
+            api_base=api_base,
+            max_results_per_query=max_results_per_query,
+            api_delay=api_delay,
+            request_timeout=request_timeout,
+            request_retries=request_retries,
+            atom_retries=atom_retries,
+            limiter=limiter,
+            http_cache=http_cache,
+        )
+
+    group_papers: Dict[str, List[Paper]] = {job[0]: [] for job in jobs}
+    complete = True
+    workers = max(1, min(api_workers, len(jobs)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [(job, pool.submit(run_job, job)) for job in jobs]
+        # Collect in submission order so output order matches the serial version.
+        for (label, _, _, chunk_from, chunk_to), future in futures:
             try:
-                chunk_papers = _fetch_api_daterange_chunk(
-                    cat,
-                    chunk_from,
-                    chunk_to,
-                    api_base=api_base,
-                    max_results_per_query=max_results_per_query,
-                    api_delay=api_delay,
-                    request_timeout=request_timeout,
-                    request_retries=request_retries,
-                    atom_retries=atom_retries,
-                )
-                category_papers.extend(chunk_papers)
+                chunk_papers, chunk_complete = future.result()
             except Exception as e:
                 if _is_dns_error(e):
-                    raise ConnectionError(f"API DNS failure while fetching {cat}: {e}") from e
+                    for _, pending in futures:
+                        pending.cancel()
+                    raise ConnectionError(f"API DNS failure while fetching {label}: {e}") from e
+                complete = False
                 log.warning(
-                    f"  [{cat}] chunk {chunk_from}-{chunk_to} failed and will be skipped: {e}"
+                    f"  [{label}] chunk {chunk_from}-{chunk_to} failed and will be skipped: {e}"
                 )
+                continue
+            group_papers[label].extend(chunk_papers)
+            complete = complete and chunk_complete
 
-            if i < len(total_chunks):
-                time.sleep(max(0.0, api_delay))
-
-        log.info(f"  [{cat}] collected {len(category_papers)} entries across chunks")
-        papers.extend(category_papers)
-
-        # Delay between categories
-        if cat != categories[-1]:
-            time.sleep(max(0.0, api_delay))
+    papers = []
+    for label, label_papers in group_papers.items():
+        log.info(f"  [{label}] collected {len(label_papers)} entries across chunks")
+        papers.extend(label_papers)
 
+    if results_key and complete:
+        http_cache.store_parsed(
+            results_key, "", "fetch_api_daterange", len(papers), len(papers), papers
+        )
     return papers
 
 
 def _build_date_chunks(date_from: str, date_to: str, chunk_days: int) -> List[Tuple[str, str]]:
-    start_dt = datetime.strptime(date_from, "%Y%m%d")
-    end_dt = datetime.strptime(date_to, "%Y%m%d")
-    if start_dt > end_dt:
-        start_dt, end_dt = end_dt, start_dt
+    start = datetime.strptime(date_from, "%Y%m%d").toordinal()
+    end = datetime.strptime(date_to, "%Y%m%d").toordinal()
+    if start > end:
+        start, end = end, start
+
+    # Chunk boundaries as day ordinals: a range() instead of timedelta stepping.
+    step = max(1, chunk_days)
+    return [
+        (_ordinal_ymd(first), _ordinal_ymd(min(first + step - 1, end)))
+        for first in range(start, end + 1, step)
+    ]
+
+
+def _ordinal_ymd(ordinal: int) -> str:
+    d = date.fromordinal(ordinal)
+    return f"{d.year:04d}{d.month:02d}{d.day:02d}"
+
 
-    chunk_days = max(1, chunk_days)
-    chunks: List[Tuple[str, str]] = []
-    cursor = start_dt
+def _window_is_closed(date_to: str) -> bool:
+    """True when a YYYYMMDD window end is old enough that its results are final."""
+    cutoff = datetime.now() - timedelta(days=CLOSED_WINDOW_LAG_DAYS)
+    return date_to < cutoff.strftime("%Y%m%d")
 
-    while cursor <= end_dt:
-        chunk_end = min(cursor + timedelta(days=chunk_days - 1), end_dt)
-        chunks.append((cursor.strftime("%Y%m%d"), chunk_end.strftime("%Y%m%d")))
-        cursor = chunk_end + timedelta(days=1)
 
-    return chunks
+def _category_clause(categories: List[str]) -> str:
+    """Build the search_query category term: cat:X or (cat:X+OR+cat:Y...)."""
+    terms = [f"cat:{c}" for c in categories]
+    return terms[0] if len(terms) == 1 else "(" + "+OR+".join(terms) + ")"
 
 
 def _fetch_api_daterange_chunk(
-    cat: str,
+    categories: List[str],
     date_from: str,
     date_to: str,
     api_base: str = ARXIV_API_BASE,
@@ -298,9 +1040,20 @@ def _fetch_api_daterange_chunk(
     request_timeout: int = DEFAULT_REQUEST_TIMEOUT,
     request_retries: int = DEFAULT_REQUEST_RETRIES,
     atom_retries: int = DEFAULT_ATOM_RETRIES,
-) -> List[Dict]:
+    limiter: Optional[TokenBucket] = None,
+    http_cache: Optional[HTTPCache] = None,
+) -> Tuple[List[Paper], bool]:
+    """
+    Page through one category group / date chunk. Returns (papers, complete),
+    where complete means the pages reported results and were followed all the
+    way to totalResults; an empty reply or a page that stops short is not.
+    """
+    if limiter is None:
+        limiter = TokenBucket.from_delay(api_delay)
+    max_age = HTTP_CACHE_TTL_CLOSED if _window_is_closed(date_to) else HTTP_CACHE_TTL_LIVE
     papers = []
-    query = f"cat:{cat}+AND+submittedDate:[{date_from}0000+TO+{date_to}2359]"
+    label = ",".join(categories)
+    query = f"{_category_clause(categories)}+AND+submittedDate:[{date_from}0000+TO+{date_to}2359]"
     start = 0
     total = None
     page_size = min(max(1, max_results_per_query), MAX_RESULTS_UPPER_BOUND)
@@ -315,51 +1068,61 @@ def _fetch_api_daterange_chunk(
         }, safe="+:[]")
         url = f"{api_base}?{params}"
 
-        root = _fetch_atom_root(
+        page_total, n_entries, page_papers = _fetch_atom_page(
             url,
+            _parse_api_entry,
             retries=atom_retries,
             timeout=request_timeout,
             request_retries=request_retries,
+            limiter=limiter,
+            http_cache=http_cache,
+            max_age=max_age,
         )
 
         if total is None:
-            total_el = root.find(f"{OPENSEARCH_NS}totalResults")
-            total = int(total_el.text) if total_el is not None and total_el.text else 0
-            log.info(f"    [{cat}] total in chunk: {total}")
+            total = page_total
+            log.info(f"    [{label}] total in chunk: {total}")
             if total == 0:
                 break
 
-        entries = root.findall(f"{ATOM_NS}entry")
-        if not entries:
+        if not n_entries:
             break
 
-        for entry in entries:
-            paper = _parse_api_entry(entry)
-            if paper:
-                papers.append(paper)
-
-        start += len(entries)
-        if start < total:
-            time.sleep(max(0.0, api_delay))
+        papers.extend(page_papers)
+        start += n_entries
 
-    return papers
+    return papers, bool(total) and start >= total
 
 
-def _fetch_atom_root(
+def _fetch_atom_page(
     url: str,
+    parse_entry: Callable[[ET.Element], Optional[Paper]],
     retries: int = DEFAULT_ATOM_RETRIES,
     timeout: int = DEFAULT_REQUEST_TIMEOUT,
     request_retries: int = DEFAULT_REQUEST_RETRIES,
-) -> ET.Element:
-    """Fetch and parse Atom XML with retries (helps against transient truncation/errors)."""
+    limiter: Optional[TokenBucket] = None,
+    http_cache: Optional[HTTPCache] = None,
+    max_age: float = 0,
+) -> Tuple[int, int, List[Paper]]:
+    """
+    Fetch and stream-parse one Atom page with retries (helps against transient
+    truncation/errors). Returns (totalResults, raw entry count, parsed papers).
+    """
     last_error = None
     for attempt in range(retries + 1):
         try:
-            xml_text = fetch_url(url, retries=request_retries, timeout=timeout)
-            return ET.fromstring(xml_text)
+            xml_bytes = fetch_bytes(
+                url,
+                retries=request_retries,
+                timeout=timeout,
+                limiter=limiter,
+                http_cache=http_cache,
+                max_age=max_age,
+            )
+            return _parse_atom_page(url, xml_bytes, parse_entry, http_cache)
         except Exception as e:
             last_error = e
-            if _is_dns_error(e):
+            if _is_dns_error(e) or _is_permanent_http_error(e):
                 break
             if attempt < retries:
                 sleep_s = 2 * (attempt + 1)
@@ -370,40 +1133,47 @@ def _fetch_atom_root(
     raise ConnectionError(f"Failed to fetch/parse Atom feed: {last_error}")
 
 
-def _parse_api_entry(entry: ET.Element) -> Optional[Dict]:
+def _parse_api_entry(entry: ET.Element) -> Optional[Paper]:
     """Parse a single <entry> from the arxiv API Atom response."""
     try:
+        raw_id = title = abstract = published = updated = ""
+        comment = journal_ref = doi = primary_cat = ""
+        authors = []
+        categories = []
+        # One pass over the children instead of a findtext() walk per field.
+        for child in entry:
+            tag = child.tag
+            if tag == _TAG_AUTHOR:
+                name = child.findtext(_TAG_NAME, "")
+                if name:
+                    authors.append(name)
+            elif tag == _TAG_CATEGORY:
+                term = child.get("term", "")
+                if term:
+                    categories.append(term)
+            elif tag == _TAG_ID:
+                raw_id = child.text or ""
+            elif tag == _TAG_TITLE:
+                title = child.text or ""
+            elif tag == _TAG_SUMMARY:
+                abstract = child.text or ""
+            elif tag == _TAG_PUBLISHED:
+                published = child.text or ""
+            elif tag == _TAG_UPDATED:
+                updated = child.text or ""
+            elif tag == _TAG_PRIMARY_CATEGORY:
+                primary_cat = child.get("term", "")
+            elif tag == _TAG_COMMENT:
+                comment = child.text or ""
+            elif tag == _TAG_JOURNAL_REF:
+                journal_ref = child.text or ""
+            elif tag == _TAG_DOI:
+                doi = child.text or ""
+
         # ID: e.g. http://arxiv.org/abs/2511.10616v1
-        raw_id = entry.findtext(f"{ATOM_NS}id", "")
         arxiv_id = raw_id.split("/abs/")[-1] if "/abs/" in raw_id else raw_id
         # Strip version
-        arxiv_id = re.sub(r"v\d+$", "", arxiv_id)
-
-        title = entry.findtext(f"{ATOM_NS}title", "")
-        abstract = entry.findtext(f"{ATOM_NS}summary", "")
-
-        authors = []
-        for author_el in entry.findall(f"{ATOM_NS}author"):
-            name = author_el.findtext(f"{ATOM_NS}name", "")
-            if name:
-                authors.append(name)
-
-        categories = []
-        primary_cat = ""
-        prim_el = entry.find(f"{ARXIV_NS}primary_category")
-        if prim_el is not None:
-            primary_cat = prim_el.get("term", "")
-
-        for cat_el in entry.findall(f"{ATOM_NS}category"):
-            term = cat_el.get("term", "")
-            if term:
-                categories.append(term)
-
-        published = entry.findtext(f"{ATOM_NS}published", "")
-        updated = entry.findtext(f"{ATOM_NS}updated", "")
-        comment = entry.findtext(f"{ARXIV_NS}comment", "")
-        journal_ref = entry.findtext(f"{ARXIV_NS}journal_ref", "")
-        doi = entry.findtext(f"{ARXIV_NS}doi", "")
+        arxiv_id = _strip_version(arxiv_id)
 
         return make_paper(
             arxiv_id=arxiv_id,
@@ -414,9 +1184,9 @@ def _parse_api_entry(entry: ET.Element) -> Optional[Dict]:
             primary_category=primary_cat,
             published=published,
             updated=updated,
-            comment=comment or "",
-            journal_ref=journal_ref or "",
-            doi=doi or "",
+            comment=comment,
+            journal_ref=journal_ref,
+            doi=doi,
         )
     except Exception as e:
         log.warning(f"Failed to parse API entry: {e}")
@@ -426,7 +1196,7 @@ def _parse_api_entry(entry: ET.Element) -> Optional[Dict]:
 # ---------------------------------------------------------------------------
 # Method 2: RSS/Atom feed (for "today's new" papers)
 # ---------------------------------------------------------------------------
-def fetch_rss_today(categories: List[str], rss_base: str = ARXIV_RSS_BASE) -> List[Dict]:
+def fetch_rss_today(categories: List[str], rss_base: str = ARXIV_RSS_BASE) -> List[Paper]:
     """
     Fetch today's new papers from the arxiv RSS/Atom feeds.
     These feeds contain exactly the daily announcement (new + cross-lists + replacements).
@@ -440,14 +1210,7 @@ def fetch_rss_today(categories: List[str], rss_base: str = ARXIV_RSS_BASE) -> Li
     log.info(f"RSS feed: {url}")
 
     try:
-        xml_text = fetch_url(url)
-        root = ET.fromstring(xml_text)
-
-        for entry in root.findall(f"{ATOM_NS}entry"):
-            paper = _parse_rss_entry(entry)
-            if paper:
-                papers.append(paper)
-
+        _, _, papers = _parse_atom_entries(fetch_bytes(url), _parse_rss_entry)
         log.info(f"  RSS returned {len(papers)} entries")
     except Exception as e:
         log.warning(f"RSS feed failed: {e}")
@@ -460,66 +1223,87 @@ def fetch_rss_today_tuned(
     rss_base: str = ARXIV_RSS_BASE,
     request_timeout: int = DEFAULT_REQUEST_TIMEOUT,
     request_retries: int = DEFAULT_REQUEST_RETRIES,
-) -> List[Dict]:
+    http_cache: Optional[HTTPCache] = None,
+    workers: int = DEFAULT_API_WORKERS,
+) -> List[Paper]:
     """
     Tunable wrapper for RSS fetch. Kept separate to preserve compatibility.
+
+    Categories are '+'-joined into one feed URL per RSS_CATEGORIES_PER_FEED
+    so long category lists never produce an over-long URL; several groups are
+    fetched concurrently and merged (cross-lists can appear in more than one).
     """
-    papers = []
-    cat_str = "+".join(categories)
-    url = f"{rss_base}/{cat_str}"
-    log.info(f"RSS feed: {url}")
-    try:
-        xml_text = fetch_url(url, retries=request_retries, timeout=request_timeout)
-        root = ET.fromstring(xml_text)
-        for entry in root.findall(f"{ATOM_NS}entry"):
-            paper = _parse_rss_entry(entry)
-            if paper:
-                papers.append(paper)
-        log.info(f"  RSS returned {len(papers)} entries")
-    except Exception as e:
-        log.warning(f"RSS feed failed: {e}")
-    return papers
+    groups = [
+        categories[i:i + RSS_CATEGORIES_PER_FEED]
+        for i in range(0, len(categories), RSS_CATEGORIES_PER_FEED)
+    ]
 
+    def fetch_group(group: List[str]) -> List[Paper]:
+        url = f"{rss_base}/{'+'.join(group)}"
+        log.info(f"RSS feed: {url}")
+        try:
+            xml_bytes = fetch_bytes(
+                url,
+                retries=request_retries,
+                timeout=request_timeout,
+                http_cache=http_cache,
+                max_age=HTTP_CACHE_TTL_LIVE,
+            )
+            _, _, papers = _parse_atom_page(url, xml_bytes, _parse_rss_entry, http_cache)
+            log.info(f"  RSS returned {len(papers)} entries")
+            return papers
+        except Exception as e:
+            log.warning(f"RSS feed failed: {e}")
+            return []
 
-def _parse_rss_entry(entry: ET.Element) -> Optional[Dict]:
-    """Parse a single <entry> from the arxiv RSS Atom feed."""
-    try:
-        # ID from <id> tag
-        raw_id = entry.findtext(f"{ATOM_NS}id", "")
-        arxiv_id = raw_id.split("/abs/")[-1] if "/abs/" in raw_id else raw_id
-        arxiv_id = re.sub(r"v\d+$", "", arxiv_id)
+    if len(groups) <= 1:
+        return fetch_group(categories)
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(groups)))) as pool:
+        results = list(pool.map(fetch_group, groups))
+    return deduplicate([p for papers in results for p in papers])
 
-        title = entry.findtext(f"{ATOM_NS}title", "")
-        abstract = entry.findtext(f"{ATOM_NS}summary", "")
 
-        # Authors — RSS feeds use <author><name> or dc:creator
+def _parse_rss_entry(entry: ET.Element) -> Optional[Paper]:
+    """Parse a single <entry> from the arxiv RSS Atom feed."""
+    try:
+        raw_id = title = abstract = published = updated = ""
+        announce_type = "new"
         authors = []
-        for author_el in entry.findall(f"{ATOM_NS}author"):
-            name = author_el.findtext(f"{ATOM_NS}name", "")
-            if name:
-                authors.append(name)
+        categories = []
+        for child in entry:
+            tag = child.tag
+            if tag == _TAG_AUTHOR:
+                # Authors — RSS feeds use <author><name> or dc:creator
+                name = child.findtext(_TAG_NAME, "")
+                if name:
+                    authors.append(name)
+            elif tag == _TAG_CATEGORY:
+                term = child.get("term", "")
+                if term:
+                    categories.append(term)
+            elif tag == _TAG_ID:
+                raw_id = child.text or ""
+            elif tag == _TAG_TITLE:
+                title = child.text or ""
+            elif tag == _TAG_SUMMARY:
+                abstract = child.text or ""
+            elif tag == _TAG_PUBLISHED:
+                published = child.text or ""
+            elif tag == _TAG_UPDATED:
+                updated = child.text or ""
+            elif "announce_type" in tag:
+                # Announce type from arxiv extension
+                announce_type = (child.text or "new").strip()
+
+        arxiv_id = raw_id.split("/abs/")[-1] if "/abs/" in raw_id else raw_id
+        arxiv_id = _strip_version(arxiv_id)
 
         # If no Atom authors, try to extract from summary (RSS feeds sometimes embed them)
         if not authors and abstract:
             # Some feeds put "Authors: X, Y, Z" in the description
-            m = re.search(r"Authors?:\s*(.+?)(?:\n|<br|$)", abstract)
+            m = _RE_AUTHORS_LINE.search(abstract)
             if m:
-                authors = [a.strip() for a in m.group(1).split(",")]
-
-        categories = []
-        for cat_el in entry.findall(f"{ATOM_NS}category"):
-            term = cat_el.get("term", "")
-            if term:
-                categories.append(term)
-
-        # Announce type from arxiv extension
-        announce_type = "new"
-        for child in entry:
-            if "announce_type" in child.tag:
-                announce_type = (child.text or "new").strip()
-
-        published = entry.findtext(f"{ATOM_NS}published", "")
-        updated = entry.findtext(f"{ATOM_NS}updated", "")
+                authors = _split_authors(m.group(1))
 
         return make_paper(
             arxiv_id=arxiv_id,
@@ -539,92 +1323,130 @@ def _parse_rss_entry(entry: ET.Element) -> Optional[Dict]:
 # ---------------------------------------------------------------------------
 # Method 3: HTML scraping fallback
 # ---------------------------------------------------------------------------
-class ArxivListParser(HTMLParser):
-    """Parse arxiv /list/{cat}/new or /list/{cat}/recent HTML pages."""
-
-    def __init__(self):
-        super().__init__()
-        self.papers = []
-        self._current = {}
-        self._in_title = False
-        self._in_abstract = False
-        self._in_authors = False
-        self._in_subjects = False
-        self._buffer = ""
-        self._current_id = ""
-        self._capture_abstract = False
-        self._dd_depth = 0
-
-    def handle_starttag(self, tag, attrs):
-        attrs_dict = dict(attrs)
-
-        # Detect arxiv ID from title links: /abs/XXXX.XXXXX
-        if tag == "a" and "href" in attrs_dict:
-            href = attrs_dict["href"]
-            if href.startswith("/abs/"):
-                self._current_id = href.replace("/abs/", "").strip()
-
-        # Title in <span class="descriptor">Title:</span> followed by content
-        cls = attrs_dict.get("class", "")
-        if tag == "span" and "descriptor" in cls:
-            self._buffer = ""
-
-        # List-title contains the title text
-        if tag == "div" and "list-title" in cls:
-            self._in_title = True
-            self._buffer = ""
-
-        # Authors
-        if tag == "div" and "list-authors" in cls:
-            self._in_authors = True
-            self._buffer = ""
-
-        # Abstract / mathjax
-        if tag == "p" and "mathjax" in cls:
-            self._in_abstract = True
-            self._buffer = ""
-
-        # Subjects line
-        if tag == "span" and "primary-subject" in cls:
-            self._in_subjects = True
-            self._buffer = ""
-
-    def handle_endtag(self, tag):
-        if tag == "div" and self._in_title:
-            self._in_title = False
-            title = self._buffer.strip()
-            # Remove "Title: " prefix
-            title = re.sub(r"^Title:\s*", "", title)
-            if self._current_id:
-                self._current["arxiv_id"] = self._current_id
-                self._current["title"] = title
-
-        if tag == "div" and self._in_authors:
-            self._in_authors = False
-            authors_text = self._buffer.strip()
-            authors_text = re.sub(r"^Authors:\s*", "", authors_text)
-            authors = [a.strip() for a in authors_text.split(",") if a.strip()]
-            self._current["authors"] = authors
+@functools.lru_cache(maxsize=None)
+def _html_list_parser_cls() -> type:
+    """Build ArxivListParser on first use.
 
-        if tag == "p" and self._in_abstract:
-            self._in_abstract = False
-            self._current["abstract"] = self._buffer.strip()
+    html.parser (and html.entities behind it) is only needed by the HTML
+    fallback, so RSS and API runs never pay for importing it.
+    """
+    from html.parser import HTMLParser
+
+    class ArxivListParser(HTMLParser):
+        """Parse arxiv /list/{cat}/new or /list/{cat}/recent HTML pages."""
 
-            # Emit paper if we have the minimum fields
-            if self._current.get("arxiv_id") and self._current.get("title"):
-                self.papers.append(make_paper(
-                    arxiv_id=self._current.get("arxiv_id", ""),
-                    title=self._current.get("title", ""),
-                    authors=self._current.get("authors", []),
-                    abstract=self._current.get("abstract", ""),
-                    categories=self._current.get("categories", []),
-                ))
-                self._current = {}
-                self._current_id = ""
+        # Only these tags carry anything we extract; everything else returns early.
+        _TAGS = frozenset(("a", "span", "div", "p"))
+
+        def __init__(self):
+            super().__init__()
+            self.papers = []
+            self._current = {}
+            self._in_title = False
+            self._in_abstract = False
+            self._in_authors = False
+            self._in_subjects = False
+            self._capturing = False
+            self._buffer = []  # text chunks, joined at the closing tag
+            self._current_id = ""
+
+        def _start_capture(self):
+            self._capturing = True
+            self._buffer = []
+
+        def _stop_capture(self):
+            self._capturing = (
+                self._in_title or self._in_authors or self._in_abstract or self._in_subjects
+            )
 
-    def handle_data(self, data):
-        if self._in_title or self._in_authors or self._in_abstract or self._in_subjects:
-            self._buffer += data
+        def handle_starttag(self, tag, attrs):
+            if tag not in self._TAGS:
+                return
+
+            # Detect arxiv ID from title links: /abs/XXXX.XXXXX
+            if tag == "a":
+                for name, value in attrs:
+                    if name == "href":
+                        if value and value.startswith("/abs/"):
+                            self._current_id = value[len("/abs/"):].strip()
+                        break
+                return
+
+            cls = ""
+            for name, value in attrs:
+                if name == "class":
+                    cls = value or ""
+                    break
+            if not cls:
+                return
+
+            if tag == "span":
+                # Title in <span class="descriptor">Title:</span> followed by content
+                if "descriptor" in cls:
+                    self._buffer = []
+                # Subjects line
+                if "primary-subject" in cls:
+                    self._in_subjects = True
+                    self._start_capture()
+            elif tag == "div":
+                # List-title contains the title text
+                if "list-title" in cls:
+                    self._in_title = True
+                    self._start_capture()
+                # Authors
+                if "list-authors" in cls:
+                    self._in_authors = True
+                    self._start_capture()
+            elif "mathjax" in cls:
+                # Abstract / mathjax
+                self._in_abstract = True
+                self._start_capture()
+
+        def handle_endtag(self, tag):
+            if tag == "div" and self._in_title:
+                self._in_title = False
+                self._stop_capture()
+                title = "".join(self._buffer).strip()
+                # Remove "Title: " prefix
+                title = _RE_TITLE_PREFIX.sub("", title)
+                if self._current_id:
+                    self._current["arxiv_id"] = self._current_id
+                    self._current["title"] = title
+
+            if tag == "div" and self._in_authors:
+                self._in_authors = False
+                self._stop_capture()
+                authors_text = "".join(self._buffer).strip()
+                authors_text = _RE_AUTHORS_PREFIX.sub("", authors_text)
+                authors = _split_authors(authors_text)
+                self._current["authors"] = authors
+
+            if tag == "p" and self._in_abstract:
+                self._in_abstract = False
+                self._stop_capture()
+                self._current["abstract"] = "".join(self._buffer).strip()
+
+                # Emit paper if we have the minimum fields
+                if self._current.get("arxiv_id") and self._current.get("title"):
+                    self.papers.append(make_paper(
+                        arxiv_id=self._current.get("arxiv_id", ""),
+                        title=self._current.get("title", ""),
+                        authors=self._current.get("authors", []),
+                        abstract=self._current.get("abstract", ""),
+                        categories=self._current.get("categories", []),
+                    ))
+                    self._current = {}
+                    self._current_id = ""
+
+            if tag == "span" and self._in_subjects:
+                self._in_subjects = False
+                self._stop_capture()
+
+        def handle_data(self, data):
+            if self._capturing:
+                self._buffer.append(data)
+
+    return ArxivListParser
 
 
 def fetch_html_listing(
@@ -634,30 +1456,61 @@ def fetch_html_listing(
     request_timeout: int = DEFAULT_REQUEST_TIMEOUT,
     request_retries: int = DEFAULT_REQUEST_RETRIES,
     html_category_delay: float = 1.0,
-) -> List[Dict]:
+    http_cache: Optional[HTTPCache] = None,
+    workers: int = DEFAULT_API_WORKERS,
+) -> List[Paper]:
     """
     Scrape arxiv /list/{cat}/{page} HTML pages.
     page: 'new', 'recent', 'pastweek', or 'YYMM' (e.g., '2511')
+
+    Categories are fetched on a small thread pool. Requests are still spaced
+    html_category_delay apart by a shared token bucket, but one category's
+    download and parse overlap the wait before the next, and cached pages
+    skip the delay entirely.
     """
-    papers = []
+    limiter = TokenBucket.from_delay(html_category_delay)
 
-    for cat in categories:
+    def scrape(cat: str) -> List[Paper]:
         url = f"{html_base}/{cat}/{page}"
         log.info(f"HTML scrape: {url}")
+        body = fetch_bytes(
+            url,
+            retries=request_retries,
+            timeout=request_timeout,
+            limiter=limiter,
+            http_cache=http_cache,
+            max_age=HTTP_CACHE_TTL_LIVE,
+        )
+        # HTMLParser is pure Python, so an unchanged listing reuses its last parse.
+        if http_cache is not None:
+            digest = hashlib.sha256(body).hexdigest()
+            memo = http_cache.load_parsed(url, digest, "ArxivListParser")
+            if memo is not None:
+                log.info(f"  Reused {len(memo[2])} parsed papers from HTML cache for {cat}")
+                return memo[2]
+        parser = _html_list_parser_cls()()
+        parser.feed(body.decode("utf-8", errors="replace"))
+        log.info(f"  Parsed {len(parser.papers)} papers from HTML for {cat}")
+        if http_cache is not None:
+            n = len(parser.papers)
+            http_cache.store_parsed(url, digest, "ArxivListParser", n, n, parser.papers)
+        return parser.papers
 
-        try:
-            html_text = fetch_url(url, retries=request_retries, timeout=request_timeout)
-            parser = ArxivListParser()
-            parser.feed(html_text)
-            log.info(f"  Parsed {len(parser.papers)} papers from HTML for {cat}")
-            papers.extend(parser.papers)
-        except Exception as e:
-            if _is_dns_error(e):
-                raise ConnectionError(f"HTML DNS failure while fetching {cat}: {e}") from e
-            log.warning(f"HTML scrape failed for {cat}: {e}")
-
-        if cat != categories[-1]:
-            time.sleep(max(0.0, html_category_delay))  # be polite
+    papers = []
+    if not categories:
+        return papers
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(categories)))) as pool:
+        futures = [(cat, pool.submit(scrape, cat)) for cat in categories]
+        # Collect in category order so output order matches the serial version.
+        for cat, future in futures:
+            try:
+                papers.extend(future.result())
+            except Exception as e:
+                if _is_dns_error(e):
+                    for _, pending in futures:
+                        pending.cancel()
+                    raise ConnectionError(f"HTML DNS failure while fetching {cat}: {e}") from e
+                log.warning(f"HTML scrape failed for {cat}: {e}")
 
     return papers
 
@@ -665,24 +1518,33 @@ def fetch_html_listing(
 # ---------------------------------------------------------------------------
 # Deduplication & filtering
 # ---------------------------------------------------------------------------
-def deduplicate(papers: List[Dict]) -> List[Dict]:
-    """Remove duplicate papers by arxiv_id, keeping the first occurrence."""
+# announce_type values that count as new submissions (not replacements)
+_NEW_ANNOUNCE_TYPES = frozenset(("new", "cross", "cross-list", ""))
+
+
+def deduplicate(papers: List[Paper], new_only: bool = False) -> List[Paper]:
+    """
+    Remove duplicate papers by arxiv_id, keeping the first occurrence.
+    With new_only, also apply filter_new_only in the same pass: an id whose
+    first occurrence is a replacement is dropped, exactly as if the two
+    functions had been called one after the other.
+    """
     seen = set()
     unique = []
     for p in papers:
-        key = re.sub(r"v\d+$", "", p["arxiv_id"])
-        if key not in seen:
-            seen.add(key)
-            unique.append(p)
+        key = _strip_version(p.arxiv_id)
+        if key in seen:
+            continue
+        seen.add(key)
+        if new_only and p.announce_type not in _NEW_ANNOUNCE_TYPES:
+            continue
+        unique.append(p)
     return unique
 
 
-def filter_new_only(papers: List[Dict]) -> List[Dict]:
+def filter_new_only(papers: List[Paper]) -> List[Paper]:
     """Keep only new submissions (not replacements)."""
-    return [
-        p for p in papers
-        if p.get("announce_type", "new") in ("new", "cross", "cross-list", "")
-    ]
+    return [p for p in papers if p.announce_type in _NEW_ANNOUNCE_TYPES]
 
 
 # ---------------------------------------------------------------------------
@@ -709,7 +1571,7 @@ def parse_period(period: str) -> Tuple[str, str, str]:
         month_ago = today - timedelta(days=30)
         return ("daterange", month_ago.strftime("%Y%m%d"), today.strftime("%Y%m%d"))
 
-    m_days = re.match(r"^(\d{1,3})d$", period)
+    m_days = _RE_DAYS.match(period)
     if m_days:
         days = max(1, int(m_days.group(1)))
         today = datetime.now()
@@ -719,8 +1581,17 @@ def parse_period(period: str) -> Tuple[str, str, str]:
     if period == "recent":
         return ("html_page", "recent", "")
 
+    return _parse_absolute_period(period)
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_absolute_period(period: str) -> Tuple[str, str, str]:
+    """
+    The calendar-anchored forms of parse_period. Unlike "week" or "7d" these
+    do not depend on the current date, so their results can be memoized.
+    """
     # Single date: YYYY-MM-DD
-    if re.match(r"^\d{4}-\d{2}-\d{2}$", period):
+    if _RE_ISODATE.match(period):
         d = period.replace("-", "")
         return ("daterange", d, d)
 
@@ -734,7 +1605,7 @@ def parse_period(period: str) -> Tuple[str, str, str]:
                 return ("daterange", d1, d2)
 
     # Month shorthand: YYYY-MM
-    if re.match(r"^\d{4}-\d{2}$", period):
+    if _RE_ISOMONTH.match(period):
         month_start = datetime.strptime(period + "-01", "%Y-%m-%d")
         if month_start.month == 12:
             next_month = month_start.replace(year=month_start.year + 1, month=1)
@@ -753,7 +1624,7 @@ def parse_period(period: str) -> Tuple[str, str, str]:
 
 def _normalize_ymd(text: str) -> str:
     token = text.replace("-", "")
-    if not re.match(r"^\d{8}$", token):
+    if not _RE_YMD.match(token):
         return ""
     try:
         datetime.strptime(token, "%Y%m%d")
@@ -779,7 +1650,9 @@ def fetch_papers(
     request_retries: int = DEFAULT_REQUEST_RETRIES,
     atom_retries: int = DEFAULT_ATOM_RETRIES,
     html_category_delay: float = 1.0,
-) -> List[Dict]:
+    api_workers: int = DEFAULT_API_WORKERS,
+    http_cache: Optional[HTTPCache] = None,
+) -> List[Paper]:
     """
     Fetch papers for the given categories and period.
     Tries API/RSS first, falls back to HTML scraping.
@@ -796,6 +1669,8 @@ def fetch_papers(
                 rss_base=rss_base,
                 request_timeout=request_timeout,
                 request_retries=request_retries,
+                http_cache=http_cache,
+                workers=api_workers,
             )
         except Exception as e:
             log.warning(f"RSS failed: {e}")
@@ -811,6 +1686,8 @@ def fetch_papers(
                     request_timeout=request_timeout,
                     request_retries=request_retries,
                     html_category_delay=html_category_delay,
+                    http_cache=http_cache,
+                    workers=api_workers,
                 )
             except Exception as e:
                 log.warning(f"HTML scrape also failed: {e}")
@@ -830,6 +1707,8 @@ def fetch_papers(
                 request_timeout=request_timeout,
                 request_retries=request_retries,
                 atom_retries=atom_retries,
+                api_workers=api_workers,
+                http_cache=http_cache,
             )
         except Exception as e:
             log.warning(f"API failed: {e}")
@@ -845,6 +1724,8 @@ def fetch_papers(
                     request_timeout=request_timeout,
                     request_retries=request_retries,
                     html_category_delay=html_category_delay,
+                    http_cache=http_cache,
+                    workers=api_workers,
                 )
             except Exception as e:
                 log.warning(f"HTML fallback also failed: {e}")
@@ -859,12 +1740,12 @@ def fetch_papers(
             request_timeout=request_timeout,
             request_retries=request_retries,
             html_category_delay=html_category_delay,
+            http_cache=http_cache,
+            workers=api_workers,
         )
 
     # Post-process
-    papers = deduplicate(papers)
-    if not include_replacements:
-        papers = filter_new_only(papers)
+    papers = deduplicate(papers, new_only=not include_replacements)
 
     log.info(f"=== Total unique papers: {len(papers)} ===")
     return papers
@@ -931,11 +1812,20 @@ def main():
         default=DEFAULT_ATOM_RETRIES,
         help=f"Top-level Atom fetch/parse retries per page (default: {DEFAULT_ATOM_RETRIES})",
     )
+    parser.add_argument(
+        "--api-workers",
+        type=int,
+        default=DEFAULT_API_WORKERS,
+        help=(
+            "Concurrent API chunk / HTML listing fetches; request pacing stays global "
+            f"(default: {DEFAULT_API_WORKERS})"
+        ),
+    )
     parser.add_argument(
         "--html-category-delay",
         type=float,
         default=1.0,
-        help="Delay between categories for HTML fallback in seconds (default: 1.0)",
+        help="Minimum spacing between HTML fallback requests in seconds (default: 1.0)",
     )
     parser.add_argument(
         "--fast",
@@ -961,11 +1851,21 @@ def main():
         "--output", "-o",
         help="Output file path (default: stdout)",
     )
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Write one JSON object per line instead of an indented JSON array",
+    )
     parser.add_argument(
         "--allow-empty-output",
         action="store_true",
         help="Allow writing an empty result set to --output (default: keep existing file unchanged when empty)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk HTTP response cache under the storage root",
+    )
     parser.add_argument(
         "--include-replacements",
         action="store_true",
@@ -989,8 +1889,7 @@ def main():
 
     if not categories and prefs_path:
         try:
-            with open(prefs_path) as f:
-                prefs = json.load(f)
+            prefs = json.loads(Path(prefs_path).read_bytes())
             categories = prefs.get("arxiv_categories", [])
             log.info(f"Loaded categories from prefs: {categories} ({prefs_path})")
         except Exception as e:
@@ -1010,6 +1909,7 @@ def main():
     request_retries = max(0, args.request_retries)
     atom_retries = max(0, args.atom_retries)
     html_category_delay = max(0.0, args.html_category_delay)
+    api_workers = max(1, args.api_workers)
 
     mode, _, _ = parse_period(args.period)
     if mode == "today":
@@ -1035,6 +1935,7 @@ def main():
         f"request_timeout={request_timeout}s, "
         f"request_retries={request_retries}, "
         f"atom_retries={atom_retries}, "
+        f"api_workers={api_workers}, "
         f"html_category_delay={html_category_delay}s"
     )
 
@@ -1053,11 +1954,13 @@ def main():
         request_retries=request_retries,
         atom_retries=atom_retries,
         html_category_delay=html_category_delay,
+        api_workers=api_workers,
+        http_cache=None if args.no_cache else HTTPCache(paths.cache / "http"),
     )
 
-    # Output
-    output_json = json.dumps(papers, indent=2, ensure_ascii=False)
-
+    # Output: stream records straight to the destination rather than
+    # materializing the whole document as one string first.
+    write_papers = write_papers_ndjson if args.ndjson else write_papers_json
     if args.output:
         output_exists = os.path.exists(args.output)
         if len(papers) == 0 and output_exists and not args.allow_empty_output:
@@ -1070,8 +1973,10 @@ def main():
             os.makedirs(out_dir, exist_ok=True)
             fd, tmp_path = tempfile.mkstemp(prefix=".arxiv_fetch_", suffix=".json.tmp", dir=out_dir)
             try:
-                with os.fdopen(fd, "w") as f:
-                    f.write(output_json)
+                # JSON is UTF-8 regardless of locale; a large buffer turns the
+                # per-record writes into a few big write(2) calls.
+                with os.fdopen(fd, "w", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE) as f:
+                    write_papers(papers, f)
                 os.replace(tmp_path, args.output)
             except Exception:
                 try:
@@ -1081,7 +1986,9 @@ def main():
                 raise
             log.info(f"Wrote {len(papers)} papers to {args.output}")
     else:
-        print(output_json)
+        write_papers(papers, sys.stdout)
+        if not args.ndjson:
+            sys.stdout.write("\n")
 
 
 if __name__ == "__main__":
@@ -26,16 +26,20 @@ import sys
 import re
 import time
 import logging
+import unicodedata
+import functools
+import heapq
 from datetime import datetime
-from collections import Counter, defaultdict
+from collections import Counter
+from operator import itemgetter
 from pathlib import Path
-from urllib.request import urlopen, Request
+from io import BytesIO
 from urllib.parse import urlencode, quote
-from urllib.error import URLError, HTTPError
 from xml.etree import ElementTree as ET
-from typing import List, Dict, Optional, Set, Tuple
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
 
-from storage_paths import get_storage_paths, update_user_record
+from arxiv_fetch import HTTPCache, TokenBucket, fetch_bytes
+from storage_paths import atomic_write_bytes, get_storage_paths, update_user_record
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 log = logging.getLogger(__name__)
@@ -43,27 +47,65 @@ log = logging.getLogger(__name__)
 ARXIV_API_BASE = "http://export.arxiv.org/api/query"
 API_DELAY = 3.1
 MAX_RESULTS = 200
-USER_AGENT = "arxiv-digest-skill/1.0"
+DEFAULT_REQUEST_RETRIES = 4
+AUTHORS_PER_QUERY = 10  # co-authors OR'd into one search_query (bounds URL length)
+HTTP_CACHE_TTL_SEARCH = 86400  # seconds; author search pages gain papers daily
+HTTP_CACHE_TTL_IDS = 15 * 86400  # seconds; metadata for known IDs rarely changes
+COAUTHOR_PAPERS_KEPT = 10  # paper IDs stored per co-author in the profile
+RECENT_PAPERS_KEPT = 20  # newest papers listed in the profile
 
 ATOM_NS = "{http://www.w3.org/2005/Atom}"
 ARXIV_NS = "{http://arxiv.org/schemas/atom}"
 OPENSEARCH_NS = "{http://a9.com/-/spec/opensearch/1.1/}"
+_TAG_ENTRY = f"{ATOM_NS}entry"
+_TAG_ID = f"{ATOM_NS}id"
+_TAG_TITLE = f"{ATOM_NS}title"
+_TAG_SUMMARY = f"{ATOM_NS}summary"
+_TAG_AUTHOR = f"{ATOM_NS}author"
+_TAG_NAME = f"{ATOM_NS}name"
+_TAG_CATEGORY = f"{ATOM_NS}category"
+_TAG_PUBLISHED = f"{ATOM_NS}published"
+_TAG_PRIMARY_CATEGORY = f"{ARXIV_NS}primary_category"
+_TAG_COMMENT = f"{ARXIV_NS}comment"
+_TAG_TOTAL_RESULTS = f"{OPENSEARCH_NS}totalResults"
+
+_RE_VERSION_SUFFIX = re.compile(r"v\d+$")
+_RE_YEAR = re.compile(r"(\d{4})")
+_RE_ID_YEAR = re.compile(r"(\d{2})\d{2}\.")
+_RE_KEYWORD = re.compile(r"[a-zA-Z][a-zA-Z0-9\-]+")
 
 
 # ---------------------------------------------------------------------------
 # HTTP helper
 # ---------------------------------------------------------------------------
-def fetch_url(url: str, retries: int = 2, timeout: int = 30) -> str:
-    req = Request(url, headers={"User-Agent": USER_AGENT})
-    for attempt in range(retries + 1):
-        try:
-            with urlopen(req, timeout=timeout) as resp:
-                return resp.read().decode("utf-8", errors="replace")
-        except (URLError, HTTPError, TimeoutError) as e:
-            log.warning(f"Attempt {attempt+1}/{retries+1} failed for {url}: {e}")
-            if attempt < retries:
-                time.sleep(2 * (attempt + 1))
-    raise ConnectionError(f"Failed to fetch {url} after {retries+1} attempts")
+# One token bucket for every API request this process makes (arxiv asks for one
+# request every few seconds); a 429/503 pauses it for all callers.
+_API_LIMITER = TokenBucket.from_delay(API_DELAY)
+
+
+def fetch_url(
+    url: str,
+    retries: int = DEFAULT_REQUEST_RETRIES,
+    timeout: int = 30,
+    http_cache: Optional[HTTPCache] = None,
+    max_age: float = 0,
+) -> bytes:
+    """
+    Fetch a URL and return the raw response body (XML is parsed from bytes).
+    This is arxiv_fetch.fetch_bytes paced by _API_LIMITER, so requests share
+    its keep-alive connections, gzip handling and retry policy. With
+    ``http_cache``, a stored response younger than ``max_age`` seconds is
+    returned without a request, and an older one is revalidated with a
+    conditional GET.
+    """
+    return fetch_bytes(
+        url,
+        retries=retries,
+        timeout=timeout,
+        limiter=_API_LIMITER,
+        http_cache=http_cache,
+        max_age=max_age,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -73,57 +115,67 @@ def search_author_papers(
     author_name: str,
     max_papers: int = 300,
     categories: Optional[List[str]] = None,
-) -> List[Dict]:
-    """Search arxiv for papers by an author. Returns list of paper dicts."""
-    papers = []
+    http_cache: Optional[HTTPCache] = None,
+) -> Iterator[Dict]:
+    """
+    Search arxiv for papers by an author, newest first. Yields paper dicts
+    page by page, so callers that stream them never hold the full list.
+    """
     # Build query: author name, optionally restricted to categories
     # Arxiv author search uses au:"Last First" format
     query = f'au:"{author_name}"'
     if categories:
         cat_query = " OR ".join(f"cat:{c}" for c in categories)
         query = f'{query} AND ({cat_query})'
+    yield from _search_papers(query, author_name, max_papers, http_cache)
 
-    start = 0
-    total = None
 
-    while total is None or start < min(total, max_papers):
+def _search_papers(
+    query: str,
+    label: str,
+    max_papers: int,
+    http_cache: Optional[HTTPCache] = None,
+) -> Iterator[Dict]:
+    """Page through an arxiv search_query, newest first. `label` is for logging."""
+
+    def page_size(start: int) -> int:
+        return min(MAX_RESULTS, max_papers - start)
+
+    def fetch_page(start: int) -> Tuple[int, int, List[Dict]]:
         params = urlencode({
             "search_query": query,
             "start": start,
-            "max_results": min(MAX_RESULTS, max_papers - start),
+            "max_results": page_size(start),
             "sortBy": "submittedDate",
             "sortOrder": "descending",
         })
         url = f"{ARXIV_API_BASE}?{params}"
         log.info(f"  Fetching author papers start={start} ...")
+        return _fetch_feed(url, http_cache=http_cache, max_age=HTTP_CACHE_TTL_SEARCH)
 
-        xml_text = fetch_url(url)
-        root = ET.fromstring(xml_text)
-
+    start = 0
+    total = None
+    while True:
+        page_total, n_entries, page_papers = fetch_page(start)
         if total is None:
-            total_el = root.find(f"{OPENSEARCH_NS}totalResults")
-            total = int(total_el.text) if total_el is not None else 0
-            log.info(f"  Total papers found for '{author_name}': {total}")
+            total = page_total
+            log.info(f"  Total papers found for '{label}': {total}")
             if total == 0:
                 break
 
-        entries = root.findall(f"{ATOM_NS}entry")
-        if not entries:
+        if not n_entries:
             break
 
-        for entry in entries:
-            paper = _parse_entry(entry)
-            if paper:
-                papers.append(paper)
-
-        start += len(entries)
-        if start < min(total, max_papers):
-            time.sleep(API_DELAY)
-
-    return papers
+        yield from page_papers
+        start += n_entries
+        if start >= min(total, max_papers):
+            break
 
 
-def fetch_papers_by_ids(arxiv_ids: List[str]) -> List[Dict]:
+def fetch_papers_by_ids(
+    arxiv_ids: List[str],
+    http_cache: Optional[HTTPCache] = None,
+) -> List[Dict]:
     """Fetch specific papers by their arxiv IDs."""
     papers = []
     # API supports comma-separated id_list
@@ -135,49 +187,95 @@ def fetch_papers_by_ids(arxiv_ids: List[str]) -> List[Dict]:
         url = f"{ARXIV_API_BASE}?{params}"
         log.info(f"  Fetching batch of {len(batch)} papers by ID ...")
 
-        xml_text = fetch_url(url)
-        root = ET.fromstring(xml_text)
+        papers.extend(_fetch_feed(url, http_cache=http_cache, max_age=HTTP_CACHE_TTL_IDS)[2])
 
-        for entry in root.findall(f"{ATOM_NS}entry"):
-            paper = _parse_entry(entry)
-            if paper:
-                papers.append(paper)
+    return papers
 
-        if i + batch_size < len(arxiv_ids):
-            time.sleep(API_DELAY)
 
-    return papers
+def _fetch_feed(
+    url: str,
+    http_cache: Optional[HTTPCache] = None,
+    max_age: float = 0,
+) -> Tuple[int, int, List[Dict]]:
+    """
+    Fetch and parse one API page. Only pages that parse and have entries stay
+    in the cache: a corrupt body is dropped and fetched once more, and an
+    entry-less page (often a transient empty reply) is not kept.
+    """
+    for attempt in range(2):
+        body = fetch_url(url, http_cache=http_cache, max_age=max_age)
+        try:
+            feed = _parse_feed(body)
+        except (ET.ParseError, ValueError) as e:
+            if http_cache is not None:
+                http_cache.discard(url)
+            if attempt:
+                raise ConnectionError(f"Unparseable response from {url}: {e}") from e
+            log.warning(f"Bad response from {url} ({e}); fetching it again")
+            continue
+        if http_cache is not None and not feed[1]:
+            http_cache.discard(url)
+        return feed
+
+
+def _parse_feed(xml_bytes: bytes) -> Tuple[int, int, List[Dict]]:
+    """
+    Stream-parse an arxiv API response in a single pass.
+    Returns (totalResults, raw entry count, successfully parsed papers).
+
+    Each <entry> is cleared once parsed, so only one entry subtree is alive
+    at a time rather than the whole response DOM.
+    """
+    total = 0
+    count = 0
+    papers = []
+    for _, elem in ET.iterparse(BytesIO(xml_bytes), events=("end",)):
+        tag = elem.tag
+        if tag == _TAG_ENTRY:
+            count += 1
+            paper = _parse_entry(elem)
+            if paper:
+                papers.append(paper)
+            elem.clear()
+        elif tag == _TAG_TOTAL_RESULTS:
+            total = int(elem.text) if elem.text else 0
+    return total, count, papers
 
 
 def _parse_entry(entry: ET.Element) -> Optional[Dict]:
     """Parse an arxiv API entry into a paper dict."""
     try:
-        raw_id = entry.findtext(f"{ATOM_NS}id", "")
-        arxiv_id = raw_id.split("/abs/")[-1] if "/abs/" in raw_id else raw_id
-        arxiv_id = re.sub(r"v\d+$", "", arxiv_id)
-
-        title = " ".join(entry.findtext(f"{ATOM_NS}title", "").split())
-        abstract = " ".join(entry.findtext(f"{ATOM_NS}summary", "").split())
-
+        raw_id = title = abstract = published = comment = primary_cat = ""
         authors = []
-        for author_el in entry.findall(f"{ATOM_NS}author"):
-            name = author_el.findtext(f"{ATOM_NS}name", "")
-            if name:
-                authors.append(name)
-
         categories = []
-        for cat_el in entry.findall(f"{ATOM_NS}category"):
-            term = cat_el.get("term", "")
-            if term:
-                categories.append(term)
-
-        primary_cat = ""
-        prim_el = entry.find(f"{ARXIV_NS}primary_category")
-        if prim_el is not None:
-            primary_cat = prim_el.get("term", "")
+        # One pass over the children instead of a find*() walk per field.
+        for child in entry:
+            tag = child.tag
+            if tag == _TAG_AUTHOR:
+                name = child.findtext(_TAG_NAME, "")
+                if name:
+                    authors.append(name)
+            elif tag == _TAG_CATEGORY:
+                term = child.get("term", "")
+                if term:
+                    categories.append(term)
+            elif tag == _TAG_ID:
+                raw_id = child.text or ""
+            elif tag == _TAG_TITLE:
+                title = child.text or ""
+            elif tag == _TAG_SUMMARY:
+                abstract = child.text or ""
+            elif tag == _TAG_PUBLISHED:
+                published = child.text or ""
+            elif tag == _TAG_PRIMARY_CATEGORY:
+                primary_cat = child.get("term", "")
+            elif tag == _TAG_COMMENT:
+                comment = child.text or ""
 
-        published = entry.findtext(f"{ATOM_NS}published", "")
-        comment = entry.findtext(f"{ARXIV_NS}comment", "") or ""
+        arxiv_id = raw_id.split("/abs/")[-1] if "/abs/" in raw_id else raw_id
+        arxiv_id = _RE_VERSION_SUFFIX.sub("", arxiv_id)
+        title = " ".join(title.split())
+        abstract = " ".join(abstract.split())
 
         return {
             "arxiv_id": arxiv_id,
@@ -187,6 +285,7 @@ def _parse_entry(entry: ET.Element) -> Optional[Dict]:
             "categories": categories,
             "primary_category": primary_cat,
             "published": published,
+            "year": _published_year(published),  # parsed once; "" if unknown
             "comment": comment,
         }
     except Exception as e:
@@ -197,12 +296,25 @@ def _parse_entry(entry: ET.Element) -> Optional[Dict]:
 # ---------------------------------------------------------------------------
 # Network builder
 # ---------------------------------------------------------------------------
+class _CoauthorStats:
+    """Running tally for one co-author (slotted: there can be thousands)."""
+
+    __slots__ = ("count", "last_year", "papers")
+
+    def __init__(self):
+        self.count = 0
+        self.last_year = 0
+        self.papers = []
+
+
 def build_network(
-    papers: List[Dict],
+    papers: Iterable[Dict],
     user_name: str,
 ) -> Dict:
     """
-    Build a collaboration network from a list of papers.
+    Build a collaboration network from papers (newest first), in one pass.
+    `papers` may be a generator: only aggregates, the paper IDs and the first
+    RECENT_PAPERS_KEPT papers are retained.
 
     Returns:
         {
@@ -212,28 +324,35 @@ def build_network(
             "topic_keywords": {keyword: count},
             "active_categories": {cat: count},
             "publication_years": {year: count},
+            "paper_ids": [arxiv_id, ...],  # every paper, in input order
+            "recent_papers": [{"arxiv_id", "title", "year"}, ...],
         }
     """
-    coauthors = defaultdict(lambda: {"count": 0, "last_year": 0, "papers": []})
-    topic_words = Counter()
+    coauthors: Dict[str, _CoauthorStats] = {}
+    paper_ids = []
+    recent_papers = []
+    title_tokens = Counter()
+    all_tokens = Counter()  # title + abstract, keyed in first-seen order
     category_counts = Counter()
     year_counts = Counter()
 
-    # Normalize user name for matching
-    user_name_lower = user_name.lower().strip()
-    user_name_parts = set(user_name_lower.split())
+    # Normalize user name for matching; author strings found to be the user
+    # are remembered, so the fuzzy check runs once per distinct name
+    user_norm = _normalize_name(user_name)
+    self_names = set()
 
     for paper in papers:
-        # Extract year
-        year = ""
-        if paper.get("published"):
-            m = re.match(r"(\d{4})", paper["published"])
-            if m:
-                year = m.group(1)
-        if not year and paper.get("arxiv_id"):
-            m = re.match(r"(\d{2})\d{2}\.", paper["arxiv_id"])
-            if m:
-                year = f"20{m.group(1)}"
+        paper_ids.append(paper["arxiv_id"])
+        if len(recent_papers) < RECENT_PAPERS_KEPT:
+            recent_papers.append({
+                "arxiv_id": paper["arxiv_id"],
+                "title": paper["title"],
+                "year": paper.get("year", ""),
+            })
+
+        # Extract year (once per paper, not per co-author)
+        year = _paper_year(paper)
+        year_int = int(year) if year else 0
 
         if year:
             year_counts[year] += 1
@@ -244,77 +363,121 @@ def build_network(
 
         # Co-authors (everyone except the user)
         for author in paper.get("authors", []):
-            author_lower = author.lower().strip()
-            author_parts = set(author_lower.split())
-
-            # Skip self — fuzzy match on name parts
-            if _is_same_person(user_name_lower, user_name_parts, author_lower, author_parts):
-                continue
-
-            coauthors[author]["count"] += 1
-            coauthors[author]["papers"].append(paper.get("arxiv_id", ""))
-            if year:
-                coauthors[author]["last_year"] = max(
-                    coauthors[author]["last_year"], int(year)
-                )
-
-        # Extract topic keywords from title
-        title_words = _extract_keywords(paper.get("title", ""))
-        topic_words.update(title_words)
+            stats = coauthors.get(author)
+            if stats is None:
+                # First sighting of this name: skip self — fuzzy match on name parts
+                if author in self_names:
+                    continue
+                if _is_same_person(user_norm, _normalize_name(author)):
+                    self_names.add(author)
+                    continue
+                stats = coauthors[author] = _CoauthorStats()
+            stats.count += 1
+            # Only the first few IDs are stored, so don't collect the rest
+            if len(stats.papers) < COAUTHOR_PAPERS_KEPT:
+                stats.papers.append(paper.get("arxiv_id", ""))
+            if year_int > stats.last_year:
+                stats.last_year = year_int
+
+        # Count raw title and abstract tokens (Counter.update over a list
+        # counts in C); stop words are dropped once per distinct word below.
+        # all_tokens sees each paper's title then abstract, so its keys keep
+        # the order in which words first appear, which most_common uses to
+        # break ties.
+        title = _tokenize(paper.get("title", ""))
+        title_tokens.update(title)
+        all_tokens.update(title)
+        all_tokens.update(_tokenize(paper.get("abstract", "")))
+
+    # Topic keywords: title words at full weight, abstract words at 0.3. The
+    # weight is computed in tenths so equal weights compare equal (summing
+    # 0.3 per word drifts in the last bit) and fall back to first-seen order.
+    topic_words = Counter()
+    for w, c in all_tokens.items():
+        if _is_keyword(w):
+            in_title = title_tokens[w]
+            topic_words[w] = (10 * in_title + 3 * (c - in_title)) / 10 if c > in_title else in_title
 
-        # Also from abstract (lighter weight)
-        abstract_words = _extract_keywords(paper.get("abstract", ""))
-        for w in abstract_words:
-            topic_words[w] += 0.3  # lower weight for abstract
+    # Rank coauthors by frequency; only the top of each list is kept, so a
+    # partial (stable) nlargest replaces a full sort
+    def by_count(name: str) -> int:
+        return coauthors[name].count
 
-    # Sort coauthors by frequency
-    coauthor_rank = sorted(coauthors.keys(), key=lambda x: coauthors[x]["count"], reverse=True)
+    coauthor_rank = heapq.nlargest(100, coauthors, key=by_count)
 
     # Active coauthors (last 3 years)
-    current_year = datetime.now().year
-    active_coauthors = [
-        name for name in coauthor_rank
-        if coauthors[name]["last_year"] >= current_year - 3
-    ]
+    active_since = datetime.now().year - 3
+    active_coauthors = heapq.nlargest(
+        50,
+        (name for name, stats in coauthors.items() if stats.last_year >= active_since),
+        key=by_count,
+    )
 
     # Clean up topic keywords — keep top 50
     top_topics = {k: round(v, 1) for k, v in topic_words.most_common(50)}
 
     # Truncate paper lists in coauthor data for storage
     coauthor_data = {}
-    for name in coauthor_rank[:100]:  # keep top 100
-        data = coauthors[name]
+    for name in coauthor_rank:  # top 100
+        stats = coauthors[name]
         coauthor_data[name] = {
-            "count": data["count"],
-            "last_year": data["last_year"],
-            "papers": data["papers"][:10],  # keep up to 10 paper IDs
+            "count": stats.count,
+            "last_year": stats.last_year,
+            "papers": stats.papers,  # up to COAUTHOR_PAPERS_KEPT paper IDs
         }
 
     return {
         "coauthors": coauthor_data,
-        "coauthor_rank": coauthor_rank[:100],
-        "active_coauthors": active_coauthors[:50],
+        "coauthor_rank": coauthor_rank,
+        "active_coauthors": active_coauthors,
         "topic_keywords": top_topics,
         "active_categories": dict(category_counts.most_common(20)),
         "publication_years": dict(sorted(year_counts.items())),
+        "paper_ids": paper_ids,
+        "recent_papers": recent_papers,
     }
 
 
+def _published_year(published: str) -> str:
+    """Return the YYYY prefix of an Atom <published> timestamp, or ""."""
+    m = _RE_YEAR.match(published)
+    return m.group(1) if m else ""
+
+
+def _paper_year(paper: Dict) -> str:
+    """Year from <published>, falling back to the YYMM prefix of a new-style arxiv ID."""
+    year = paper.get("year", "")
+    if not year and paper.get("arxiv_id"):
+        m = _RE_ID_YEAR.match(paper["arxiv_id"])
+        if m:
+            year = f"20{m.group(1)}"
+    return year
+
+
+@functools.lru_cache(maxsize=None)
+def _normalize_name(name: str) -> Tuple[str, Tuple[str, ...]]:
+    """Case-folded name and its name parts; computed once per distinct author string."""
+    # NFKC first so composed and decomposed accents (and compatibility forms)
+    # compare equal; casefold also handles cases lower() misses (e.g. "ß").
+    name_lower = unicodedata.normalize("NFKC", name).casefold().strip()
+    return name_lower, tuple(name_lower.split())
+
+
 def _is_same_person(
-    name1_lower: str, name1_parts: Set[str],
-    name2_lower: str, name2_parts: Set[str],
+    name1: Tuple[str, Tuple[str, ...]],
+    name2: Tuple[str, Tuple[str, ...]],
 ) -> bool:
-    """Fuzzy check if two author names refer to the same person."""
+    """Fuzzy check if two normalized author names refer to the same person."""
+    name1_lower, parts1 = name1
+    name2_lower, parts2 = name2
     # Exact match
     if name1_lower == name2_lower:
         return True
 
     # Check if last names match and at least one first-name initial matches
     # This handles "J. Smith" vs "John Smith" vs "Jane Smith" (imperfect but useful)
-    if len(name1_parts) >= 2 and len(name2_parts) >= 2:
+    if len(parts1) >= 2 and len(parts2) >= 2:
         # Get last name (last token)
-        parts1 = name1_lower.split()
-        parts2 = name2_lower.split()
         if parts1[-1] == parts2[-1]:  # same last name
             # Check first name/initial overlap
             first1 = parts1[0].rstrip(".")
@@ -330,7 +493,7 @@ def _is_same_person(
 
 
 # Stop words for keyword extraction
-_STOP_WORDS = {
+_STOP_WORDS = frozenset({
     "a", "an", "the", "of", "in", "on", "at", "to", "for", "and", "or",
     "is", "are", "was", "were", "be", "been", "being", "with", "from",
     "by", "as", "it", "its", "this", "that", "these", "those", "we",
@@ -343,16 +506,17 @@ _STOP_WORDS = {
     "but", "if", "about", "each", "all", "both", "do", "does", "did",
     "has", "have", "had", "such", "only", "very", "just", "over", "under",
     "then", "so", "well", "here", "there", "some", "any", "other",
-}
+})
+
 
+def _tokenize(text: str) -> List[str]:
+    """Lowercase word tokens of text, punctuation removed (stop words kept)."""
+    return _RE_KEYWORD.findall(text.lower())
 
-def _extract_keywords(text: str) -> List[str]:
-    """Extract meaningful keywords from text."""
-    # Tokenize, lowercase, remove punctuation
-    words = re.findall(r"[a-zA-Z][a-zA-Z0-9\-]+", text.lower())
-    # Filter stop words and short words
-    keywords = [w for w in words if w not in _STOP_WORDS and len(w) > 2]
-    return keywords
+
+def _is_keyword(word: str) -> bool:
+    """Filter for _tokenize output: drop stop words and short words."""
+    return len(word) > 2 and word not in _STOP_WORDS
 
 
 # ---------------------------------------------------------------------------
@@ -362,47 +526,105 @@ def expand_network_second_degree(
     network: Dict,
     top_n: int = 10,
     max_papers_per_coauthor: int = 50,
+    http_cache: Optional[HTTPCache] = None,
+    own_paper_ids: Iterable[str] = (),
+    user_name: str = "",
 ) -> Dict:
     """
     For the top N most frequent co-authors, fetch THEIR recent papers
     and extract their co-authors. This gives us the 2nd-degree network.
 
     This is expensive (many API calls), so only do it for the closest collaborators.
+    Co-authors are searched AUTHORS_PER_QUERY at a time; each is credited up to
+    max_papers_per_coauthor papers, and members left short are re-queried.
+    The user (own papers and spellings of `user_name`) is excluded.
     Returns an updated network dict with "second_degree" field.
     """
     second_degree = Counter()
-    top_coauthors = network.get("coauthor_rank", [])[:top_n]
+    own_ids = set(own_paper_ids)
+
+    # "J. Smith" and "John Smith" would return largely the same papers and
+    # count them twice; search each person under their best-ranked spelling.
+    top_coauthors: List[str] = []
+    for name in network.get("coauthor_rank", [])[:top_n]:
+        norm = _normalize_name(name)
+        if any(_is_same_person(norm, _normalize_name(kept)) for kept in top_coauthors):
+            continue
+        top_coauthors.append(name)
+
+    groups = [
+        top_coauthors[i:i + AUTHORS_PER_QUERY]
+        for i in range(0, len(top_coauthors), AUTHORS_PER_QUERY)
+    ]
 
-    for coauthor_name in top_coauthors:
-        log.info(f"Expanding network for co-author: {coauthor_name}")
-        try:
-            coauthor_papers = search_author_papers(
-                coauthor_name,
-                max_papers=max_papers_per_coauthor,
-            )
-            for paper in coauthor_papers:
-                for author in paper.get("authors", []):
-                    author_lower = author.lower().strip()
-                    # Skip the co-author themselves
-                    if _is_same_person(
-                        coauthor_name.lower(), set(coauthor_name.lower().split()),
-                        author_lower, set(author_lower.split()),
-                    ):
+    def expand(group: List[str]) -> Counter:
+        """Second-degree counts for one group of co-authors."""
+        label = ", ".join(group)
+        log.info(f"Expanding network for co-author(s): {label}")
+        counts = Counter()
+        group_norms = [(name, _normalize_name(name)) for name in group]
+        credited = Counter()
+        # arxiv_id -> group members on that paper, for papers already tallied
+        seen: Dict[str, List[str]] = {}
+        pending = list(group)
+        while pending:
+            # A re-query returns the papers already seen for these members
+            # first (same newest-first order), so the budget covers those too.
+            overlap = sum(1 for members in seen.values() if any(m in pending for m in members))
+            budget = overlap + sum(max_papers_per_coauthor - credited[m] for m in pending)
+            query = " OR ".join(f'au:"{name}"' for name in pending)
+            progress = False
+            returned = 0
+            for paper in _search_papers(query, label, budget, http_cache):
+                returned += 1
+                arxiv_id = paper.get("arxiv_id")
+                if arxiv_id in seen:
+                    continue
+                author_norms = [(a, _normalize_name(a)) for a in paper.get("authors", [])]
+                members = seen[arxiv_id] = []
+                for coauthor_name, coauthor_norm in group_norms:
+                    if not any(_is_same_person(coauthor_norm, norm) for _, norm in author_norms):
+                        continue
+                    members.append(coauthor_name)
+                    if credited[coauthor_name] >= max_papers_per_coauthor:
+                        continue
+                    credited[coauthor_name] += 1
+                    progress = True
+                    if arxiv_id in own_ids:
                         continue
-                    second_degree[author] += 1
-            time.sleep(API_DELAY)
+                    for author, norm in author_norms:
+                        # Skip the co-author themselves
+                        if not _is_same_person(coauthor_norm, norm):
+                            counts[author] += 1
+                if all(credited[m] >= max_papers_per_coauthor for m in pending):
+                    break
+            pending = [m for m in pending if credited[m] < max_papers_per_coauthor]
+            if returned < budget or not progress:
+                break  # results ran out (or the re-query found nothing new)
+            label = ", ".join(pending)
+        return counts
+
+    # Tally in rank order so Counter ties break deterministically.
+    for group in groups:
+        try:
+            second_degree.update(expand(group))
         except Exception as e:
-            log.warning(f"Failed to expand for {coauthor_name}: {e}")
+            log.warning(f"Failed to expand for {', '.join(group)}: {e}")
 
-    # Remove people already in 1st degree
+    # Remove the user and people already in 1st degree, then keep the top 100
     first_degree = set(network.get("coauthor_rank", []))
-    second_only = {
-        name: count for name, count in second_degree.most_common(200)
-        if name not in first_degree
-    }
+    user_norm = _normalize_name(user_name)
+    second_only = heapq.nlargest(
+        100,
+        (
+            (name, count) for name, count in second_degree.items()
+            if name not in first_degree and not _is_same_person(user_norm, _normalize_name(name))
+        ),
+        key=itemgetter(1),
+    )
 
-    network["second_degree"] = dict(list(second_only.items())[:100])
-    network["second_degree_rank"] = list(second_only.keys())[:100]
+    network["second_degree"] = dict(second_only)
+    network["second_degree_rank"] = [name for name, _ in second_only]
 
     return network
 
@@ -412,24 +634,26 @@ def expand_network_second_degree(
 # ---------------------------------------------------------------------------
 def build_profile(
     user_name: str,
-    papers: List[Dict],
+    papers: Iterable[Dict],
     orcid: str = "",
     affiliation: str = "",
     homepage: str = "",
     expand_second_degree: bool = False,
+    http_cache: Optional[HTTPCache] = None,
 ) -> Dict:
-    """Build a complete researcher profile."""
+    """Build a complete researcher profile. `papers` is consumed once and may be a generator."""
     log.info(f"Building profile for: {user_name}")
-    log.info(f"  Papers found: {len(papers)}")
 
     network = build_network(papers, user_name)
+    # The user's own arxiv IDs
+    own_paper_ids = network["paper_ids"]
+    log.info(f"  Papers found: {len(own_paper_ids)}")
 
     if expand_second_degree and network.get("coauthor_rank"):
         log.info("Expanding to 2nd-degree network...")
-        network = expand_network_second_degree(network)
-
-    # Extract the user's own arxiv IDs
-    own_paper_ids = [p["arxiv_id"] for p in papers]
+        network = expand_network_second_degree(
+            network, http_cache=http_cache, own_paper_ids=own_paper_ids, user_name=user_name,
+        )
 
     # Determine primary research categories
     cat_counts = network.get("active_categories", {})
@@ -446,18 +670,9 @@ def build_profile(
             "homepage": homepage,
         },
         "publications": {
-            "total_count": len(papers),
+            "total_count": len(own_paper_ids),
             "paper_ids": own_paper_ids[:200],
-            "recent_papers": [
-                {
-                    "arxiv_id": p["arxiv_id"],
-                    "title": p["title"],
-                    "year": re.match(r"(\d{4})", p.get("published", "")).group(1)
-                        if p.get("published") and re.match(r"(\d{4})", p["published"])
-                        else "",
-                }
-                for p in papers[:20]  # most recent 20
-            ],
+            "recent_papers": network["recent_papers"],  # most recent 20
             "primary_categories": primary_categories,
             "publication_years": network.get("publication_years", {}),
         },
@@ -478,7 +693,7 @@ def build_profile(
     return profile
 
 
-def update_profile(existing_profile: Dict) -> Dict:
+def update_profile(existing_profile: Dict, http_cache: Optional[HTTPCache] = None) -> Dict:
     """Refresh an existing profile by re-fetching papers."""
     researcher = existing_profile.get("researcher", {})
     name = researcher.get("name", "")
@@ -489,7 +704,7 @@ def update_profile(existing_profile: Dict) -> Dict:
     categories = existing_profile.get("publications", {}).get("primary_categories", [])
 
     log.info(f"Updating profile for: {name}")
-    papers = search_author_papers(name, categories=categories or None)
+    papers = search_author_papers(name, categories=categories or None, http_cache=http_cache)
 
     return build_profile(
         user_name=name,
@@ -497,9 +712,55 @@ def update_profile(existing_profile: Dict) -> Dict:
         orcid=researcher.get("orcid", ""),
         affiliation=researcher.get("affiliation", ""),
         homepage=researcher.get("homepage", ""),
+        http_cache=http_cache,
     )
 
 
+def _stream_papers(
+    papers: Iterator[Dict],
+    extra_ids: List[str],
+    http_cache: Optional[HTTPCache] = None,
+) -> Iterator[Dict]:
+    """
+    Yield the author-search papers, then any of `extra_ids` they did not
+    include. Papers are consumed as they arrive, so a network failure part
+    way through cannot discard the pages already yielded: the search ends
+    early and the profile is built from a partial list, with a warning
+    giving the count.
+    """
+    known_ids = set()
+    try:
+        for paper in papers:
+            known_ids.add(paper["arxiv_id"])
+            yield paper
+    except ConnectionError as e:
+        log.error(f"Network error: {e}")
+        log.error("Cannot reach arxiv API. Check your network connection.")
+        if known_ids:
+            log.warning(
+                f"Author search stopped after {len(known_ids)} paper(s); "
+                "the profile is built from these only and may be incomplete."
+            )
+
+    missing = [aid for aid in extra_ids if aid not in known_ids]
+    if missing:
+        try:
+            yield from fetch_papers_by_ids(missing, http_cache=http_cache)
+        except ConnectionError as e:
+            log.warning(f"Could not fetch extra papers: {e}")
+
+
+def write_profile(profile: Dict, path: Path) -> None:
+    """
+    Write a profile as indented UTF-8 JSON, atomically: the document is
+    serialized in one call, written to a temp file beside `path`, and renamed
+    over it, so an interrupted run never leaves a truncated profile.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = json.dumps(profile, indent=2, ensure_ascii=False).encode("utf-8")
+    atomic_write_bytes(path, data)
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
@@ -533,10 +794,16 @@ def main():
     )
     parser.add_argument("--output", "-o",
                         help="Output file path (default: storage/researcher_profile.json, or --update path in update mode)")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk HTTP response cache under the storage root",
+    )
     parser.add_argument("--quiet", "-q", action="store_true")
 
     args = parser.parse_args()
     paths = get_storage_paths(args.storage_dir)
+    http_cache = None if args.no_cache else HTTPCache(paths.cache / "http")
 
     if args.quiet:
         logging.getLogger().setLevel(logging.ERROR)
@@ -544,12 +811,9 @@ def main():
     # Update mode
     if args.update:
         output_path = Path(args.output).expanduser().resolve() if args.output else Path(args.update).expanduser().resolve()
-        with open(args.update) as f:
-            existing = json.load(f)
-        profile = update_profile(existing)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w") as f:
-            json.dump(profile, f, indent=2, ensure_ascii=False)
+        existing = json.loads(Path(args.update).read_bytes())
+        profile = update_profile(existing, http_cache=http_cache)
+        write_profile(profile, output_path)
         update_user_record(paths, profile_path=output_path)
         log.info(f"Updated profile written to {output_path}")
         return
@@ -559,31 +823,17 @@ def main():
         log.error("--name is required (or use --update to refresh an existing profile)")
         sys.exit(1)
 
-    # Fetch papers
-    try:
-        papers = search_author_papers(
+    # Papers are streamed from the search straight into build_profile, then
+    # supplemented with any --arxiv-ids the search did not return
+    papers = _stream_papers(
+        search_author_papers(
             args.name,
             categories=args.categories,
-        )
-    except ConnectionError as e:
-        log.error(f"Network error: {e}")
-        log.error("Cannot reach arxiv API. Check your network connection.")
-        papers = []
-
-    # Supplement with specific arxiv IDs if provided
-    if args.arxiv_ids:
-        known_ids = {p["arxiv_id"] for p in papers}
-        extra_ids = [aid for aid in args.arxiv_ids if aid not in known_ids]
-        if extra_ids:
-            try:
-                extra_papers = fetch_papers_by_ids(extra_ids)
-                papers.extend(extra_papers)
-            except ConnectionError as e:
-                log.warning(f"Could not fetch extra papers: {e}")
-
-    if not papers:
-        log.warning(f"No papers found for '{args.name}'. "
-                     "Try providing --arxiv-ids or adjusting the name format.")
+            http_cache=http_cache,
+        ),
+        args.arxiv_ids or [],
+        http_cache,
+    )
 
     profile = build_profile(
         user_name=args.name,
@@ -592,12 +842,15 @@ def main():
         affiliation=args.affiliation or "",
         homepage=args.homepage or "",
         expand_second_degree=args.expand_network,
+        http_cache=http_cache,
     )
 
+    if not profile["publications"]["total_count"]:
+        log.warning(f"No papers found for '{args.name}'. "
+                     "Try providing --arxiv-ids or adjusting the name format.")
+
     output_path = Path(args.output).expanduser().resolve() if args.output else paths.profile
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        json.dump(profile, f, indent=2, ensure_ascii=False)
+    write_profile(profile, output_path)
     update_user_record(paths, profile_path=output_path)
 
     log.info(f"Profile written to {output_path}")
@@ -8,6 +8,7 @@ arxiv-digest data.
 Usage:
     python3 storage_manager.py init              # Initialize storage directory
     python3 storage_manager.py status            # Check what files exist
+    python3 storage_manager.py status --json     # Same check as one JSON line
     python3 storage_manager.py paths             # Show storage paths
     python3 storage_manager.py backup [dest]     # Backup all data
     python3 storage_manager.py restore [src]     # Restore from backup
@@ -16,18 +17,39 @@ Usage:
 Dependencies: Python 3.8+ standard library only
 """
 
-import argparse
+import bisect
+import functools
 import json
-import shutil
+import os
+import re
 import sys
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
-from storage_paths import StoragePaths, get_storage_paths, update_user_record
+from storage_paths import (
+    StoragePaths,
+    _dump_json_bytes,
+    _read_json,
+    _write_json,
+    atomic_write_bytes,
+    get_storage_paths,
+    update_user_record,
+    update_user_record_read_state,
+)
 
 
 DATE_FMT = "%Y-%m-%d"
+# Zero-padded YYYY-MM-DD, the form date.fromisoformat parses identically on
+# every supported Python; anything looser goes through strptime(DATE_FMT).
+_RE_ISO_DATE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+# tarfile copies member data in 16 KiB chunks by default; larger buffers cut
+# syscalls substantially on big history trees.
+TAR_COPY_BUFSIZE = 2 * 1024 * 1024
+# Same level as `gzip`/`tar -z`; tarfile's default of 9 is much slower for ~1% gain.
+TAR_GZIP_LEVEL = 6
+# Archive roots restore accepts: the portable layout, then legacy ~/.claude backups.
+BACKUP_ROOT_PREFIXES = ("arxiv-digest", ".claude/arxiv-digest")
 
 
 def init_storage(paths: StoragePaths, verbose: bool = True) -> bool:
@@ -35,9 +57,12 @@ def init_storage(paths: StoragePaths, verbose: bool = True) -> bool:
     try:
         paths.root.mkdir(parents=True, exist_ok=True)
         paths.history.mkdir(exist_ok=True)
-        if not paths.read_state.exists():
-            with open(paths.read_state, "w") as f:
-                json.dump(_read_state_default(), f, indent=2, ensure_ascii=False)
+        try:
+            # "x" creates the file only if it is missing: no separate exists() check.
+            with open(paths.read_state, "xb") as f:
+                f.write(_dump_json_bytes(_read_state_default()))
+        except FileExistsError:
+            pass
         update_user_record(paths)
 
         if verbose:
@@ -54,40 +79,53 @@ def init_storage(paths: StoragePaths, verbose: bool = True) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=1)
+def _today() -> str:
+    """Today's date, computed once per command (main() clears it on entry)."""
+    return datetime.now().strftime(DATE_FMT)
+
+
+def _parse_date(date_text: str) -> date:
+    if _RE_ISO_DATE.fullmatch(date_text):
+        return date.fromisoformat(date_text)
+    return datetime.strptime(date_text, DATE_FMT).date()
+
+
+@functools.lru_cache(maxsize=4096)
 def _normalize_date(date_text: str) -> str:
-    dt = datetime.strptime(date_text, DATE_FMT)
-    return dt.strftime(DATE_FMT)
+    # Memoized: the same stored/marked dates are normalized repeatedly per run.
+    if _RE_ISO_DATE.fullmatch(date_text):
+        date.fromisoformat(date_text)  # validates; the text is already canonical
+        return date_text
+    return datetime.strptime(date_text, DATE_FMT).strftime(DATE_FMT)
 
 
 def _date_range(start_date: str, end_date: str) -> List[str]:
-    start_dt = datetime.strptime(_normalize_date(start_date), DATE_FMT).date()
-    end_dt = datetime.strptime(_normalize_date(end_date), DATE_FMT).date()
+    start_dt = _parse_date(start_date)
+    end_dt = _parse_date(end_date)
     if start_dt > end_dt:
         start_dt, end_dt = end_dt, start_dt
-    dates: List[str] = []
-    cursor = start_dt
-    while cursor <= end_dt:
-        dates.append(cursor.strftime(DATE_FMT))
-        cursor += timedelta(days=1)
-    return dates
+    # isoformat() is exactly DATE_FMT without strftime's format parsing.
+    from_ordinal = date.fromordinal
+    return [
+        from_ordinal(day).isoformat()
+        for day in range(start_dt.toordinal(), end_dt.toordinal() + 1)
+    ]
+
+
+# Immutable fields of a fresh read state; read_dates and updated_at are
+# filled per call so no mutable list is shared between states.
+_READ_STATE_TEMPLATE = {"version": 1, "last_read_date": ""}
 
 
 def _read_state_default() -> Dict:
-    return {
-        "version": 1,
-        "last_read_date": "",
-        "read_dates": [],
-        "updated_at": datetime.now().strftime(DATE_FMT),
-    }
+    return {**_READ_STATE_TEMPLATE, "read_dates": [], "updated_at": _today()}
 
 
 def _load_read_state(paths: StoragePaths) -> Dict:
-    if not paths.read_state.exists():
-        return _read_state_default()
     try:
-        with open(paths.read_state) as f:
-            data = json.load(f)
-        if not isinstance(data, dict):
+        data = _read_json(paths.read_state)  # {} when missing or unreadable
+        if not data:
             return _read_state_default()
         read_dates = data.get("read_dates", [])
         if not isinstance(read_dates, list):
@@ -99,7 +137,7 @@ def _load_read_state(paths: StoragePaths) -> Dict:
             "version": 1,
             "last_read_date": data.get("last_read_date", ""),
             "read_dates": cleaned,
-            "updated_at": data.get("updated_at", datetime.now().strftime(DATE_FMT)),
+            "updated_at": data.get("updated_at", _today()),
         }
         if state["last_read_date"]:
             state["last_read_date"] = _normalize_date(state["last_read_date"])
@@ -112,21 +150,27 @@ def _load_read_state(paths: StoragePaths) -> Dict:
 
 def _save_read_state(paths: StoragePaths, state: Dict) -> None:
     paths.root.mkdir(parents=True, exist_ok=True)
-    state["updated_at"] = datetime.now().strftime(DATE_FMT)
-    with open(paths.read_state, "w") as f:
-        json.dump(state, f, indent=2, ensure_ascii=False)
-    update_user_record(paths)
+    state["updated_at"] = _today()
+    _write_json(paths.read_state, state)
+    update_user_record_read_state(paths, state)
 
 
 def mark_read_days(paths: StoragePaths, dates: List[str], verbose: bool = True) -> bool:
     try:
         state = _load_read_state(paths)
-        merged: Set[str] = set(state.get("read_dates", []))
-        merged.update(_normalize_date(d) for d in dates)
-        read_dates = sorted(merged)
+        # _load_read_state returns read_dates sorted and deduplicated (ISO
+        # dates sort lexically), so insert new days in place.
+        read_dates: List[str] = state.get("read_dates", [])
+        old_count, old_last = len(read_dates), state.get("last_read_date", "")
+        for day in {_normalize_date(d) for d in dates}:
+            idx = bisect.bisect_left(read_dates, day)
+            if idx == len(read_dates) or read_dates[idx] != day:
+                read_dates.insert(idx, day)
         state["read_dates"] = read_dates
         state["last_read_date"] = read_dates[-1] if read_dates else ""
-        _save_read_state(paths, state)
+        # Re-marking days already read leaves the state as stored: skip the writes.
+        if len(read_dates) != old_count or state["last_read_date"] != old_last:
+            _save_read_state(paths, state)
         if verbose:
             print(f"✓ Marked {len(dates)} day(s) as read")
             print(f"  Last read date: {state['last_read_date'] or 'N/A'}")
@@ -140,11 +184,13 @@ def mark_read_days(paths: StoragePaths, dates: List[str], verbose: bool = True)
 def mark_unread_days(paths: StoragePaths, dates: List[str], verbose: bool = True) -> bool:
     try:
         state = _load_read_state(paths)
+        old_dates, old_last = state.get("read_dates", []), state.get("last_read_date", "")
         remove_set = {_normalize_date(d) for d in dates}
-        read_dates = [d for d in state.get("read_dates", []) if d not in remove_set]
+        read_dates = [d for d in old_dates if d not in remove_set]
         state["read_dates"] = read_dates
         state["last_read_date"] = read_dates[-1] if read_dates else ""
-        _save_read_state(paths, state)
+        if len(read_dates) != len(old_dates) or state["last_read_date"] != old_last:
+            _save_read_state(paths, state)
         if verbose:
             print(f"✓ Marked {len(dates)} day(s) as unread")
             print(f"  Last read date: {state['last_read_date'] or 'N/A'}")
@@ -161,17 +207,17 @@ def get_unread_range(
     default_days: int = 7,
     max_days: int = 30,
 ) -> Tuple[str, str, int]:
-    until_day = _normalize_date(until) if until else datetime.now().strftime(DATE_FMT)
+    until_day = _normalize_date(until) if until else _today()
     state = _load_read_state(paths)
     last_read = state.get("last_read_date", "")
 
     if last_read:
-        start_dt = datetime.strptime(last_read, DATE_FMT).date() + timedelta(days=1)
+        start_dt = _parse_date(last_read) + timedelta(days=1)
     else:
         window = max(1, min(default_days, max_days))
-        start_dt = datetime.strptime(until_day, DATE_FMT).date() - timedelta(days=window - 1)
+        start_dt = _parse_date(until_day) - timedelta(days=window - 1)
 
-    until_dt = datetime.strptime(until_day, DATE_FMT).date()
+    until_dt = _parse_date(until_day)
     if start_dt > until_dt:
         return "", "", 0
 
@@ -193,67 +239,153 @@ def _expand_days_args(date_arg: Optional[str], range_arg: Optional[str]) -> List
             raise ValueError("range must be START:END in YYYY-MM-DD format")
         dates.extend(_date_range(parts[0].strip(), parts[1].strip()))
     if not dates:
-        dates.append(datetime.now().strftime(DATE_FMT))
+        dates.append(_today())
     return sorted(set(dates))
 
 
-def check_status(paths: StoragePaths, verbose: bool = True) -> dict:
-    """Check the status of stored files."""
-    if paths.root.exists():
-        update_user_record(paths)
+def _probe_storage(paths: StoragePaths) -> Dict[str, bool]:
+    """
+    Report which storage entries exist using a single directory scan of the
+    root instead of one stat() per path. Keys match check_status()'s result.
+    """
+    present: Set[str] = set()
+    storage_exists = True
+    try:
+        with os.scandir(paths.root) as entries:
+            for entry in entries:
+                # Match Path.exists(): a dangling symlink does not count.
+                if not entry.is_symlink() or os.path.exists(entry.path):
+                    present.add(entry.name)
+    except FileNotFoundError:
+        storage_exists = False
+    except NotADirectoryError:
+        pass  # root exists but is a file, so none of its entries do
 
-    status = {
-        "storage_exists": paths.root.exists(),
-        "profile_exists": paths.profile.exists(),
-        "prefs_exists": paths.prefs.exists(),
-        "record_exists": paths.record.exists(),
-        "history_exists": paths.history.exists(),
-        "read_state_exists": paths.read_state.exists(),
+    return {
+        "storage_exists": storage_exists,
+        "profile_exists": paths.profile.name in present,
+        "prefs_exists": paths.prefs.name in present,
+        "record_exists": paths.record.name in present,
+        "history_exists": paths.history.name in present,
+        "read_state_exists": paths.read_state.name in present,
     }
 
-    if verbose:
-        print("Storage Status:")
-        print(f"  Storage directory: {'✓' if status['storage_exists'] else '✗'} {paths.root}")
-        print(f"  Researcher profile: {'✓' if status['profile_exists'] else '✗'} {paths.profile}")
-        print(f"  Preferences: {'✓' if status['prefs_exists'] else '✗'} {paths.prefs}")
-        print(f"  User record: {'✓' if status['record_exists'] else '✗'} {paths.record}")
-        print(f"  History: {'✓' if status['history_exists'] else '✗'} {paths.history}")
-        print(f"  Read state: {'✓' if status['read_state_exists'] else '✗'} {paths.read_state}")
 
-        if status['profile_exists']:
-            try:
-                with open(paths.profile) as f:
-                    profile = json.load(f)
-                    name = profile.get('researcher', {}).get('name', 'Unknown')
-                    papers = profile.get('publications', {}).get('total_count', 0)
-                    built = profile.get('built_at', 'Unknown')
-                    print(f"    → Name: {name}")
-                    print(f"    → Papers: {papers}")
-                    print(f"    → Built: {built}")
-            except Exception as e:
-                print(f"    → Error reading profile: {e}")
-
-        if status['prefs_exists']:
-            try:
-                with open(paths.prefs) as f:
-                    prefs = json.load(f)
-                    interests = len(prefs.get('core_interests', []))
-                    categories = len(prefs.get('arxiv_categories', []))
-                    updated = prefs.get('last_updated', 'Unknown')
-                    print(f"    → Interests: {interests}")
-                    print(f"    → Categories: {categories}")
-                    print(f"    → Updated: {updated}")
-            except Exception as e:
-                print(f"    → Error reading preferences: {e}")
-
-        if status['history_exists']:
-            history_files = list(paths.history.glob("*.json"))
-            print(f"    → History entries: {len(history_files)}")
-
-        if status['read_state_exists']:
-            state = _load_read_state(paths)
-            print(f"    → Last read date: {state.get('last_read_date') or 'N/A'}")
-            print(f"    → Read dates tracked: {len(state.get('read_dates', []))}")
+def _count_history_entries(paths: StoragePaths) -> int:
+    """Count history/*.json files from directory entries alone (no per-file stat)."""
+    try:
+        with os.scandir(paths.history) as entries:
+            return sum(
+                1
+                for entry in entries
+                if entry.name.endswith(".json")
+                and not entry.name.startswith(".")  # glob("*.json") skips dotfiles
+                and entry.is_file()
+            )
+    except OSError:
+        return 0
+
+
+def _print_status_checklist(paths: StoragePaths, status: Dict[str, bool]) -> None:
+    print("Storage Status:")
+    print(f"  Storage directory: {'✓' if status['storage_exists'] else '✗'} {paths.root}")
+    print(f"  Researcher profile: {'✓' if status['profile_exists'] else '✗'} {paths.profile}")
+    print(f"  Preferences: {'✓' if status['prefs_exists'] else '✗'} {paths.prefs}")
+    print(f"  User record: {'✓' if status['record_exists'] else '✗'} {paths.record}")
+    print(f"  History: {'✓' if status['history_exists'] else '✗'} {paths.history}")
+    print(f"  Read state: {'✓' if status['read_state_exists'] else '✗'} {paths.read_state}")
+
+
+def check_status(paths: StoragePaths, verbose: bool = True, deep: bool = True) -> dict:
+    """
+    Check the status of stored files.
+
+    deep=False prints only the existence checklist, skipping the profile/prefs
+    summaries, history count and read-state details.
+    """
+    status = _probe_storage(paths)
+    if not (verbose and deep):
+        if status["storage_exists"]:
+            update_user_record(paths)
+            status["record_exists"] = True
+            status["history_exists"] = True
+        if verbose:
+            _print_status_checklist(paths, status)
+        return status
+
+    from concurrent.futures import ThreadPoolExecutor, wait
+
+    # Read the storage files concurrently (worthwhile on slow/networked
+    # homes): the profile, prefs and record parses land in the shared JSON
+    # cache, so the record rebuild below parses nothing itself, and the
+    # history scan keeps running alongside it.
+    record_files: Dict = {}
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        history_count = pool.submit(_count_history_entries, paths)
+        read_state = pool.submit(_load_read_state, paths) if status["read_state_exists"] else None
+        prefetched = [
+            pool.submit(_read_json, path)
+            for path, key in (
+                (paths.profile, "profile_exists"),
+                (paths.prefs, "prefs_exists"),
+                (paths.record, "record_exists"),
+            )
+            if status[key]
+        ]
+        if status["storage_exists"]:
+            wait(prefetched + ([read_state] if read_state else []))
+            # Always writes the record and creates history/ if it was missing.
+            record_files = update_user_record(paths).get("files", {})
+            status["record_exists"] = True
+            status["history_exists"] = True
+
+    _print_status_checklist(paths, status)
+
+    if status['profile_exists']:
+        # update_user_record just parsed the profile; reuse its summary
+        # rather than deserializing the whole publication list again.
+        summary = record_files.get("researcher_profile", {}).get("summary")
+        try:
+            if summary is not None:
+                name = summary.get('name') or 'Unknown'
+                papers = summary.get('publication_count', 0)
+                built = summary.get('built_at') or 'Unknown'
+            else:
+                profile = json.loads(paths.profile.read_bytes())
+                name = profile.get('researcher', {}).get('name', 'Unknown')
+                papers = profile.get('publications', {}).get('total_count', 0)
+                built = profile.get('built_at', 'Unknown')
+            print(f"    → Name: {name}")
+            print(f"    → Papers: {papers}")
+            print(f"    → Built: {built}")
+        except Exception as e:
+            print(f"    → Error reading profile: {e}")
+
+    if status['prefs_exists']:
+        summary = record_files.get("arxiv_preferences", {}).get("summary")
+        try:
+            if summary is not None:
+                interests = summary.get('core_interests_count', 0)
+                categories = len(summary.get('arxiv_categories', []))
+                updated = summary.get('last_updated') or 'Unknown'
+            else:
+                prefs = json.loads(paths.prefs.read_bytes())
+                interests = len(prefs.get('core_interests', []))
+                categories = len(prefs.get('arxiv_categories', []))
+                updated = prefs.get('last_updated', 'Unknown')
+            print(f"    → Interests: {interests}")
+            print(f"    → Categories: {categories}")
+            print(f"    → Updated: {updated}")
+        except Exception as e:
+            print(f"    → Error reading preferences: {e}")
+
+    if status['history_exists']:
+        print(f"    → History entries: {history_count.result()}")
+
+    if read_state is not None:
+        state = read_state.result()
+        print(f"    → Last read date: {state.get('last_read_date') or 'N/A'}")
+        print(f"    → Read dates tracked: {len(state.get('read_dates', []))}")
 
     return status
 
@@ -267,10 +399,24 @@ def show_paths(paths: StoragePaths):
     print(f"  Record: {paths.record}")
     print(f"  History: {paths.history}")
     print(f"  Read state: {paths.read_state}")
+    print(f"  Cache: {paths.cache}")
+
+
+def _backup_compression(dest: str) -> str:
+    """
+    Compression implied by a backup file name: "xz" for .xz/.txz, "" for a
+    plain .tar (e.g. when the upload target compresses on its own), else "gz".
+    """
+    name = dest.lower()
+    if name.endswith(".tar"):
+        return ""
+    if name.endswith((".xz", ".txz")):
+        return "xz"
+    return "gz"
 
 
 def backup_storage(paths: StoragePaths, dest: Optional[str] = None) -> bool:
-    """Backup all storage to a tar.gz file."""
+    """Backup all storage to a tar archive (gzip unless `dest` says otherwise)."""
     if not paths.root.exists():
         print("✗ No storage directory found. Nothing to backup.", file=sys.stderr)
         return False
@@ -280,10 +426,30 @@ def backup_storage(paths: StoragePaths, dest: Optional[str] = None) -> bool:
         dest = f"arxiv-digest-backup-{timestamp}.tar.gz"
 
     try:
-        # Create a temporary copy to tar
+        if _backup_with_tar_binary(paths, dest):
+            print(f"✓ Backup created: {dest}")
+            print(f"  To restore: python3 storage_manager.py restore {dest}")
+            return True
+
         import tarfile
-        with tarfile.open(dest, "w:gz") as tar:
-            tar.add(paths.root, arcname="arxiv-digest")
+
+        compression = _backup_compression(dest)
+        mode_kwargs = {"compresslevel": TAR_GZIP_LEVEL} if compression == "gz" else {}
+        with open(dest, "wb", buffering=TAR_COPY_BUFSIZE) as raw, tarfile.open(
+            mode=f"w:{compression}",
+            fileobj=raw,
+            copybufsize=TAR_COPY_BUFSIZE,
+            **mode_kwargs,
+        ) as tar:
+            # HTTP cache is re-creatable and can be large; keep it out of backups.
+            # The archive itself is skipped in case `dest` lies inside the root.
+            _add_tree_to_tar(
+                tar,
+                paths.root,
+                "arxiv-digest",
+                skip={paths.cache.name},
+                exclude=os.fstat(raw.fileno()),
+            )
 
         print(f"✓ Backup created: {dest}")
         print(f"  To restore: python3 storage_manager.py restore {dest}")
@@ -293,8 +459,136 @@ def backup_storage(paths: StoragePaths, dest: Optional[str] = None) -> bool:
         return False
 
 
+def _add_tree_to_tar(
+    tar,
+    root: Path,
+    arcname: str,
+    skip: Set[str] = frozenset(),
+    exclude: Optional[os.stat_result] = None,
+) -> None:
+    """
+    Add `root` recursively (same member order as TarFile.add) from one
+    os.scandir per directory, building each TarInfo from the entry's lstat
+    result and caching owner/group name lookups instead of repeating them
+    for every member. Top-level entries named in `skip` are left out, and
+    so is the file `exclude` was stat'ed from (the archive being written,
+    should it live under `root`). Hard-linked files after the first become
+    link members, as with TarFile.add. Anything other than files,
+    directories and symlinks goes through TarFile.add.
+    """
+    import stat as stat_mod
+    import tarfile
+
+    try:
+        import grp
+        import pwd
+    except ImportError:  # Windows
+        grp = pwd = None
+    names: Dict[Tuple[str, int], str] = {}
+
+    def owner_name(kind: str, ident: int) -> str:
+        key = (kind, ident)
+        if key not in names:
+            try:
+                names[key] = pwd.getpwuid(ident)[0] if kind == "u" else grp.getgrgid(ident)[0]
+            except (KeyError, AttributeError):
+                names[key] = ""
+        return names[key]
+
+    def add(path: str, name: str, st) -> None:
+        if exclude is not None and (st.st_dev, st.st_ino) == (exclude.st_dev, exclude.st_ino):
+            return
+        mode = st.st_mode
+        info = tarfile.TarInfo(name)
+        info.mode = stat_mod.S_IMODE(mode)
+        info.mtime = st.st_mtime
+        info.uid, info.gid = st.st_uid, st.st_gid
+        info.uname, info.gname = owner_name("u", st.st_uid), owner_name("g", st.st_gid)
+        if stat_mod.S_ISREG(mode):
+            inode = (st.st_ino, st.st_dev)
+            if st.st_nlink > 1 and inode in tar.inodes:
+                info.type = tarfile.LNKTYPE
+                info.linkname = tar.inodes[inode]
+                tar.addfile(info)
+                return
+            if st.st_nlink > 1:
+                tar.inodes[inode] = name
+            info.size = st.st_size
+            with open(path, "rb") as f:
+                tar.addfile(info, f)
+        elif stat_mod.S_ISDIR(mode):
+            info.type = tarfile.DIRTYPE
+            tar.addfile(info)
+            with os.scandir(path) as it:
+                children = sorted(it, key=lambda e: e.name)
+            for entry in children:
+                if name == arcname and entry.name in skip:
+                    continue
+                add(entry.path, f"{name}/{entry.name}", entry.stat(follow_symlinks=False))
+        elif stat_mod.S_ISLNK(mode):
+            info.type = tarfile.SYMTYPE
+            info.linkname = os.readlink(path)
+            tar.addfile(info)
+        else:
+            tar.add(path, arcname=name, recursive=False)
+
+    add(str(root), arcname, os.lstat(root))
+
+
+def _backup_with_tar_binary(paths: StoragePaths, dest: str) -> bool:
+    """
+    Stream the backup through the system `tar`, which compresses much faster
+    than Python's tarfile. Returns False so the caller falls back to tarfile
+    when tar is unavailable, fails, the storage root is not named
+    `arxiv-digest` (members must keep that prefix for restore), or `dest`
+    lies inside the root (tar would archive its own half-written output;
+    the tarfile path skips it).
+    """
+    import shutil
+
+    tar_bin = shutil.which("tar")
+    if tar_bin is None or paths.root.name != "arxiv-digest":
+        return False
+    import subprocess
+
+    dest_path = Path(dest).expanduser().resolve()
+    root = paths.root.resolve()
+    if root == dest_path or root in dest_path.parents:
+        return False
+    compression = _backup_compression(dest)
+    if compression == "gz":
+        # pigz writes ordinary gzip using every core, so restore is unaffected.
+        pigz_bin = shutil.which("pigz")
+        compress_args = [f"--use-compress-program={pigz_bin}"] if pigz_bin else ["-z"]
+    else:
+        compress_args = ["-J"] if compression == "xz" else []
+    cmd = [
+        tar_bin,
+        *compress_args,
+        "-cf", str(dest_path),
+        # HTTP cache is re-creatable and can be large; keep it out of backups.
+        f"--exclude=arxiv-digest/{paths.cache.name}",
+        "-C", str(paths.root.parent),
+        "arxiv-digest",
+    ]
+    try:
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    except OSError:
+        return False
+    if result.returncode == 0:
+        return True
+
+    err = result.stderr.decode("utf-8", errors="replace").strip()
+    print(f"  tar exited {result.returncode} ({err}); falling back to tarfile", file=sys.stderr)
+    try:
+        os.unlink(dest_path)
+    except OSError:
+        pass
+    return False
+
+
 def restore_storage(paths: StoragePaths, src: str) -> bool:
-    """Restore storage from a backup tar.gz file."""
+    """Restore storage from a backup archive (.tar.gz, .tar.xz or plain .tar)."""
     src_path = Path(src)
     if not src_path.exists():
         print(f"✗ Backup file not found: {src}", file=sys.stderr)
@@ -303,38 +597,67 @@ def restore_storage(paths: StoragePaths, src: str) -> bool:
     try:
         import tarfile
 
-        # Extract to home directory
-        with tarfile.open(src, "r:gz") as tar:
-            # Safety check: ensure all paths are within expected roots.
-            for member in tar.getmembers():
-                if not (
-                    member.name.startswith("arxiv-digest")
-                    or member.name.startswith(".claude/arxiv-digest")
-                ):
+        with tarfile.open(src, "r:*", copybufsize=TAR_COPY_BUFSIZE) as tar:
+            # Validate every header before writing anything. TarFile caches
+            # the members it reads, so extractall() below reuses this scan
+            # instead of reading the archive index again.
+            uses_portable_root = False
+            portable_prefix = BACKUP_ROOT_PREFIXES[0]
+            for member in tar:
+                name = member.name
+                # Safety check: ensure all paths are within expected roots.
+                if not name.startswith(BACKUP_ROOT_PREFIXES):
                     print(
                         "✗ Invalid backup: contains files outside arxiv-digest roots",
                         file=sys.stderr,
                     )
                     return False
+                if not uses_portable_root and name.startswith(portable_prefix):
+                    uses_portable_root = True
 
-            member_names = [m.name for m in tar.getmembers() if m.name]
-            uses_portable_root = any(name.startswith("arxiv-digest") for name in member_names)
+            extract_kwargs = {}
+            if hasattr(tarfile, "data_filter"):
+                # Python 3.12+ (and backports): also reject links/modes that escape the root.
+                extract_kwargs["filter"] = "data"
             if uses_portable_root:
                 paths.root.parent.mkdir(parents=True, exist_ok=True)
-                tar.extractall(path=paths.root.parent)
+                tar.extractall(path=paths.root.parent, **extract_kwargs)
             else:
                 # Backward compatibility with old backups that use .claude/arxiv-digest
-                tar.extractall(path=Path.home())
+                tar.extractall(path=Path.home(), **extract_kwargs)
 
         print(f"✓ Restored from: {src}")
-        update_user_record(paths)
-        check_status(paths)
+        # check_status rewrites the user record itself; only make sure the
+        # root exists (a legacy backup extracts under ~/.claude instead).
+        paths.root.mkdir(parents=True, exist_ok=True)
+        check_status(paths, deep=False)
         return True
     except Exception as e:
         print(f"✗ Restore failed: {e}", file=sys.stderr)
         return False
 
 
+def _remove_tree(root: Path) -> None:
+    """
+    Delete `root` recursively. `rm -rf` unlinks large history trees without
+    per-entry Python overhead; shutil.rmtree is the portable fallback and also
+    mops up anything rm left behind.
+    """
+    import shutil
+
+    rm_bin = shutil.which("rm") if os.name == "posix" else None
+    if rm_bin is not None:
+        import subprocess
+
+        try:
+            subprocess.run([rm_bin, "-rf", "--", str(root)], stderr=subprocess.DEVNULL)
+        except OSError:
+            pass
+        if not os.path.lexists(root):
+            return
+    shutil.rmtree(root)
+
+
 def reset_storage(paths: StoragePaths, confirm: bool = False) -> bool:
     """Delete all storage data."""
     if not paths.root.exists():
@@ -349,7 +672,7 @@ def reset_storage(paths: StoragePaths, confirm: bool = False) -> bool:
             return False
 
     try:
-        shutil.rmtree(paths.root)
+        _remove_tree(paths.root)
         print(f"✓ Storage deleted: {paths.root}")
         return True
     except Exception as e:
@@ -377,13 +700,13 @@ def create_default_preferences(
         "negative_signals": [],
         "favorite_authors": [],
         "arxiv_categories": categories or ["astro-ph.CO"],
-        "last_updated": datetime.now().strftime("%Y-%m-%d"),
+        "last_updated": _today(),
         "history": []
     }
 
     try:
-        with open(paths.prefs, 'w') as f:
-            json.dump(prefs, f, indent=2, ensure_ascii=False)
+        # Kept indented: preferences are meant to be read and hand-edited.
+        atomic_write_bytes(paths.prefs, _dump_json_bytes(prefs))
         update_user_record(paths)
         print(f"✓ Created default preferences at: {paths.prefs}")
         return True
@@ -392,7 +715,9 @@ def create_default_preferences(
         return False
 
 
-def main():
+def _build_parser():
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Manage arxiv-digest persistent storage",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -419,14 +744,30 @@ Examples:
     subparsers.add_parser("init", help="Initialize storage directory")
 
     # Status command
-    subparsers.add_parser("status", help="Check storage status")
+    status_parser = subparsers.add_parser("status", help="Check storage status")
+    status_output = status_parser.add_mutually_exclusive_group()
+    status_output.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the existence flags as one JSON object instead of the report",
+    )
+    status_output.add_argument(
+        "--quiet", "-q",
+        action="store_true",
+        help="Print nothing; only refresh the user record",
+    )
 
     # Paths command
     subparsers.add_parser("paths", help="Show storage paths")
 
     # Backup command
     backup_parser = subparsers.add_parser("backup", help="Backup all data")
-    backup_parser.add_argument("dest", nargs="?", help="Destination file (default: arxiv-digest-backup-TIMESTAMP.tar.gz)")
+    backup_parser.add_argument(
+        "dest",
+        nargs="?",
+        help="Destination file (default: arxiv-digest-backup-TIMESTAMP.tar.gz); "
+        "a .tar name skips compression and .tar.xz uses xz",
+    )
 
     # Restore command
     restore_parser = subparsers.add_parser("restore", help="Restore from backup")
@@ -470,6 +811,20 @@ Examples:
         help="Cap unread span in days (default: 30)",
     )
 
+    return parser
+
+
+def main():
+    _today.cache_clear()
+    # Argument-free `status`/`paths`/`init` are the common quick calls; skip
+    # importing and building the argparse tree for them.
+    argv = sys.argv[1:]
+    quick_commands = {"status": check_status, "paths": show_paths, "init": init_storage}
+    if len(argv) == 1 and argv[0] in quick_commands:
+        result = quick_commands[argv[0]](get_storage_paths())
+        return 1 if result is False else 0
+
+    parser = _build_parser()
     args = parser.parse_args()
     paths = get_storage_paths(args.storage_dir)
 
@@ -481,7 +836,12 @@ Examples:
     if args.command == "init":
         success = init_storage(paths)
     elif args.command == "status":
-        check_status(paths)
+        if args.json or args.quiet:
+            status = check_status(paths, verbose=False)
+            if args.json:
+                print(json.dumps(status, separators=(",", ":")))
+        else:
+            check_status(paths)
         success = True
     elif args.command == "paths":
         show_paths(paths)
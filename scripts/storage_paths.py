@@ -15,22 +15,23 @@ Safety guard:
   remove user data.
 """
 
+import functools
 import json
 import os
-from dataclasses import dataclass
+import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, NamedTuple, Optional, Tuple
 
 
-@dataclass(frozen=True)
-class StoragePaths:
+class StoragePaths(NamedTuple):
     root: Path
     profile: Path
     prefs: Path
     record: Path
     history: Path
     read_state: Path
+    cache: Path
 
 
 def get_storage_paths(storage_dir: Optional[str] = None) -> StoragePaths:
@@ -42,6 +43,7 @@ def get_storage_paths(storage_dir: Optional[str] = None) -> StoragePaths:
         record=root / "user_record.json",
         history=root / "history",
         read_state=root / "read_state.json",
+        cache=root / "cache",
     )
 
 
@@ -54,32 +56,83 @@ def update_user_record(
     paths: StoragePaths,
     profile_path: Optional[Path] = None,
     prefs_path: Optional[Path] = None,
+    read_state: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
-    """Write/update user_record.json with pointers and lightweight summaries."""
+    """
+    Write/update user_record.json with pointers and lightweight summaries.
+
+    `read_state` is the document the caller has just written to
+    paths.read_state; its summary is taken from it instead of the file.
+    """
     ensure_storage_dirs(paths)
+    record = _compute_user_record(paths, profile_path, prefs_path, read_state)
+    existing = _read_json(paths.record)
+    if (
+        existing.get("version") == record["version"]
+        and existing.get("storage_root") == record["storage_root"]
+        and existing.get("created_at") == record["created_at"]
+        and existing.get("files") == record["files"]
+    ):
+        # Nothing it indexes changed (entries carry each file's size and
+        # mtime), so a status-style refresh does not rewrite the record.
+        return existing
+    _write_user_record(paths, record)
+    return record
+
 
+def update_user_record_read_state(paths: StoragePaths, read_state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Refresh only the read_state entry of user_record.json after the caller
+    wrote `read_state`, keeping the profile/prefs entries as recorded. Falls
+    back to a full update_user_record() when there is no usable record.
+    """
+    existing = _read_json(paths.record)
+    files = existing.get("files")
+    if (
+        existing.get("version") != 1
+        or existing.get("storage_root") != str(paths.root)
+        or not isinstance(files, dict)
+        or not {"researcher_profile", "arxiv_preferences"} <= files.keys()
+    ):
+        return update_user_record(paths, read_state=read_state)
+
+    # Build a new dict: `existing` is the shared cached parse.
+    record = dict(existing)
+    record["updated_at"] = _now_iso()
+    record["files"] = {**files, "read_state": _build_read_state_entry(paths.read_state, read_state)}
+    _write_user_record(paths, record)
+    return record
+
+
+def _compute_user_record(
+    paths: StoragePaths,
+    profile_path: Optional[Path] = None,
+    prefs_path: Optional[Path] = None,
+    read_state: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
     profile = (profile_path or paths.profile).expanduser()
     prefs = (prefs_path or paths.prefs).expanduser()
 
-    existing = _read_json(paths.record) if paths.record.exists() else {}
-    created_at = existing.get("created_at", _now_iso())
+    existing = _read_json(paths.record)  # {} when there is no record yet
+    now = _now_iso()
+    created_at = existing.get("created_at", now)
 
     record: Dict[str, Any] = {
         "version": 1,
         "created_at": created_at,
-        "updated_at": _now_iso(),
+        "updated_at": now,
         "storage_root": str(paths.root),
         "files": {
             "researcher_profile": _build_profile_entry(profile),
             "arxiv_preferences": _build_prefs_entry(prefs),
-            "read_state": _build_read_state_entry(paths.read_state),
+            "read_state": _build_read_state_entry(paths.read_state, read_state),
         },
     }
+    return record
 
-    with open(paths.record, "w") as f:
-        json.dump(record, f, indent=2, ensure_ascii=False)
 
-    return record
+def _write_user_record(paths: StoragePaths, record: Dict[str, Any]) -> None:
+    _write_json(paths.record, record)
 
 
 def _resolve_storage_root(storage_dir: Optional[str] = None) -> Path:
@@ -121,7 +174,7 @@ def _is_skill_install_path(path: Path) -> bool:
 
 def _build_profile_entry(path: Path) -> Dict[str, Any]:
     info: Dict[str, Any] = _file_info(path)
-    if not path.exists():
+    if not info["exists"]:
         return info
 
     data = _read_json(path)
@@ -137,7 +190,7 @@ def _build_profile_entry(path: Path) -> Dict[str, Any]:
 
 def _build_prefs_entry(path: Path) -> Dict[str, Any]:
     info: Dict[str, Any] = _file_info(path)
-    if not path.exists():
+    if not info["exists"]:
         return info
 
     data = _read_json(path)
@@ -152,12 +205,13 @@ def _build_prefs_entry(path: Path) -> Dict[str, Any]:
     return info
 
 
-def _build_read_state_entry(path: Path) -> Dict[str, Any]:
+def _build_read_state_entry(path: Path, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     info: Dict[str, Any] = _file_info(path)
-    if not path.exists():
+    if not info["exists"]:
         return info
 
-    data = _read_json(path)
+    if data is None:
+        data = _read_json(path)
     if data:
         read_dates = data.get("read_dates", [])
         info["summary"] = {
@@ -169,24 +223,97 @@ def _build_read_state_entry(path: Path) -> Dict[str, Any]:
 
 
 def _file_info(path: Path) -> Dict[str, Any]:
-    info: Dict[str, Any] = {
+    try:
+        stat = path.stat()
+    except OSError:
+        return {"path": str(path), "exists": False}
+    return {
         "path": str(path),
-        "exists": path.exists(),
+        "exists": True,
+        "size_bytes": stat.st_size,
+        "modified_at": datetime.fromtimestamp(stat.st_mtime).isoformat(),
     }
-    if path.exists():
-        stat = path.stat()
-        info["size_bytes"] = stat.st_size
-        info["modified_at"] = datetime.fromtimestamp(stat.st_mtime).isoformat()
-    return info
 
 
-def _read_json(path: Path) -> Dict[str, Any]:
+@functools.lru_cache(maxsize=None)
+def _new_file_mode() -> int:
+    """Mode open() would give a new file: 0o666 minus the process umask."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """
+    Write `data` to a temp file beside `path` and rename it over `path`.
+    The temp file (created 0600 by mkstemp) is given the mode of the file it
+    replaces, or the umask default for a new file, before the rename.
+    """
+    try:
+        mode = path.stat().st_mode & 0o7777
+    except OSError:
+        mode = _new_file_mode()
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
     try:
-        with open(path) as f:
-            data = json.load(f)
-            return data if isinstance(data, dict) else {}
+        with os.fdopen(fd, "wb") as f:
+            if hasattr(os, "fchmod"):  # not on Windows, where mode bits barely apply
+                os.fchmod(f.fileno(), mode)
+            f.write(data)
+        os.replace(tmp_path, path)
     except Exception:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _dump_json_bytes(obj: Any) -> bytes:
+    """Serialize a storage document: 2-space indent, UTF-8, non-ASCII kept as-is."""
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+# Parsed JSON documents keyed by path, tagged with the (st_mtime_ns, st_size)
+# they were read at, so one CLI run parses each storage file at most once per
+# change. Cached dicts are shared: callers must not mutate them.
+_JSON_CACHE: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+def _stat_key(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _read_json(path: Path) -> Dict[str, Any]:
+    key = _stat_key(path)
+    if key is None:
         return {}
+    cached = _JSON_CACHE.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    try:
+        data = json.loads(path.read_bytes())
+    except Exception:
+        data = None
+    if not isinstance(data, dict):
+        data = {}
+    _JSON_CACHE[path] = (key, data)
+    return data
+
+
+def _write_json(path: Path, data: Dict[str, Any]) -> None:
+    """
+    Atomically write a storage document and keep it as the cached parse of
+    `path`; readers never see a half-written file.
+    """
+    _JSON_CACHE.pop(path, None)
+    atomic_write_bytes(path, _dump_json_bytes(data))
+    key = _stat_key(path)
+    if key is not None:
+        _JSON_CACHE[path] = (key, data)
 
 
 def _now_iso() -> str: